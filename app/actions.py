@@ -15,6 +15,7 @@ from app.policy import PolicyDecision
 SAFE_MESSAGES_PATH = Path("config/locales/en/safe_messages.yaml")
 _SAFE_MESSAGES_CACHE: dict[Path, tuple[float, dict[str, dict[str, str]]]] = {}
 _SAFE_MESSAGES_LOCK = RLock()
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def apply_actions(
@@ -109,7 +110,7 @@ def _safe_messages() -> dict[str, dict[str, str]]:
             return cached[1]
 
     payload = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(payload) or {}
+    data = yaml.load(payload, Loader=_YAML_LOADER) or {}
     safe_messages = data.get("safe_messages")
     if not isinstance(safe_messages, dict):
         parsed: dict[str, dict[str, str]] = {}
@@ -5,7 +5,9 @@ from __future__ import annotations
 import base64
 import ipaddress
 import json
+import math
 import re
+from collections import Counter
 from collections.abc import Iterable
 from hashlib import sha256
 from typing import Any
@@ -23,6 +25,19 @@ def hash_snippet(value: str) -> str:
     return f"sha256:{digest}"
 
 
+def shannon_entropy(value: str) -> float:
+    """Shannon entropy of ``value`` in bits per character."""
+    length = len(value)
+    if length == 0:
+        return 0.0
+    # Counter tallies characters in C; the Python loop only visits distinct ones
+    entropy = 0.0
+    for count in Counter(value).values():
+        probability = count / length
+        entropy -= probability * math.log(probability, 2)
+    return entropy
+
+
 def mask_preview(value: str, *, visible_prefix: int = 1, visible_suffix: int = 1) -> str:
     if not value:
         return MASK_PLACEHOLDER
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 import re
 from collections.abc import Sequence
 from typing import Any
@@ -14,6 +13,7 @@ from . import common
 
 BASE64_BLOB_REGEX = re.compile(r"(?:[A-Za-z0-9+/]{80}\s*){10,}")
 HEX_BLOB_REGEX = re.compile(r"(?:[0-9A-Fa-f]{64}\s*){10,}")
+WHITESPACE_REGEX = re.compile(r"\s+")
 
 
 def scan(
@@ -42,8 +42,8 @@ def _scan_base64(text: str) -> list[tuple[str, tuple[int, int], dict[str, Any]]]
     results: list[tuple[str, tuple[int, int], dict[str, Any]]] = []
     for match in BASE64_BLOB_REGEX.finditer(text):
         blob = match.group(0)
-        compact = re.sub(r"\s+", "", blob)
-        if len(compact) < 800 or _entropy(compact) < 4.5:
+        compact = WHITESPACE_REGEX.sub("", blob)
+        if len(compact) < 800 or common.shannon_entropy(compact) < 4.5:
             continue
         detail = {
             "masked": "[base64-blob]",
@@ -59,7 +59,7 @@ def _scan_hex(text: str) -> list[tuple[str, tuple[int, int], dict[str, Any]]]:
     results: list[tuple[str, tuple[int, int], dict[str, Any]]] = []
     for match in HEX_BLOB_REGEX.finditer(text):
         blob = match.group(0)
-        compact = re.sub(r"\s+", "", blob)
+        compact = WHITESPACE_REGEX.sub("", blob)
         if len(compact) < 640:  # 64 chars * 10 blocks
             continue
         detail = {
@@ -70,16 +70,3 @@ def _scan_hex(text: str) -> list[tuple[str, tuple[int, int], dict[str, Any]]]:
         }
         results.append((blob, match.span(), detail))
     return results
-
-
-def _entropy(value: str) -> float:
-    if not value:
-        return 0.0
-    counts: dict[str, int] = {}
-    for char in value:
-        counts[char] = counts.get(char, 0) + 1
-    entropy = 0.0
-    for count in counts.values():
-        probability = count / len(value)
-        entropy -= probability * math.log(probability, 2)
-    return entropy
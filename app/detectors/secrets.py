@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import base64
-import math
 import re
 from collections.abc import Callable, Sequence
 from typing import Any
@@ -55,9 +54,8 @@ def _run_scanner(
     rule: PolicyRule,
     text: str,
 ) -> list[tuple[str, tuple[int, int], dict[str, Any]]]:
-    if rule.pattern:
-        pattern = re.compile(rule.pattern, re.IGNORECASE)
-        return _regex_matches(pattern, text)
+    if rule.compiled_pattern is not None:
+        return _regex_matches(rule.compiled_pattern, text)
 
     scanners: dict[str, Callable[[str], list[tuple[str, tuple[int, int], dict[str, Any]]]]] = {
         "jwt": _scan_jwt,
@@ -129,7 +127,7 @@ def _scan_aws_secret_keys(text: str) -> list[tuple[str, tuple[int, int], dict[st
     results: list[tuple[str, tuple[int, int], dict[str, Any]]] = []
     for match in AWS_SECRET_KEY_REGEX.finditer(text):
         token = match.group(0)
-        entropy = _shannon_entropy(token)
+        entropy = common.shannon_entropy(token)
         if entropy < 3.5:
             continue
         detail = {
@@ -213,7 +211,7 @@ def _scan_high_entropy_tokens(text: str) -> list[tuple[str, tuple[int, int], dic
         if token in seen:
             continue
         seen.add(token)
-        entropy = _shannon_entropy(token)
+        entropy = common.shannon_entropy(token)
         if entropy < 3.5:
             continue
         if not any(char.islower() for char in token):
@@ -269,17 +267,3 @@ def _pad_base64(segment: str) -> str:
     if padding:
         segment += "=" * (4 - padding)
     return segment
-
-
-def _shannon_entropy(value: str) -> float:
-    length = len(value)
-    if length == 0:
-        return 0.0
-    counts: dict[str, int] = {}
-    for char in value:
-        counts[char] = counts.get(char, 0) + 1
-    entropy = 0.0
-    for count in counts.values():
-        probability = count / length
-        entropy -= probability * math.log(probability, 2)
-    return entropy
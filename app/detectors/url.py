@@ -68,9 +68,8 @@ def _run_scanner(
     rule: PolicyRule,
     text: str,
 ) -> list[tuple[str, tuple[int, int], dict[str, Any]]]:
-    if rule.pattern:
-        pattern = re.compile(rule.pattern, re.IGNORECASE)
-        return _regex_matches(pattern, text)
+    if rule.compiled_pattern is not None:
+        return _regex_matches(rule.compiled_pattern, text)
 
     scanners: dict[str, Callable[[str], list[tuple[str, tuple[int, int], dict[str, Any]]]]] = {
         "ip": _scan_ip_urls,
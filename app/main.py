@@ -4,17 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated, Any
 
 import structlog
 from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field
 
-from app import metrics
-from app.pipeline import GuardRequest, run_pipeline
-from app.settings import Settings, get_settings
+from app import metrics, observability_async
+from app.pipeline import GuardRequest, run_pipeline, run_pipeline_batch
+from app.settings import Settings, SettingsSnapshot, get_settings
 
-SettingsDep = Annotated[Settings, Depends(get_settings)]
+SettingsDep = Annotated[SettingsSnapshot, Depends(get_settings)]
+
+# Upper bound on items per /guard/batch call; larger workloads should page
+MAX_BATCH_ITEMS = 64
 
 # Security logger for auth/limit events
 _security_logger = structlog.get_logger("security")
@@ -57,7 +62,7 @@ def configure_logging(log_level: str) -> None:
     logging.basicConfig(level=numeric_level, format="%(message)s")
     structlog.configure(
         processors=[
-            structlog.processors.TimeStamper(fmt="iso"),
+            observability_async.add_timestamp,
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
@@ -74,6 +79,12 @@ class GuardRequestModel(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class GuardBatchRequestModel(BaseModel):
+    responses: list[str] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+    policy_id: str = Field(default="default")
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
 class GuardResponseModel(BaseModel):
     response: str
     findings: list[dict[str, Any]]
@@ -84,16 +95,22 @@ class GuardResponseModel(BaseModel):
     version: str
 
 
-def create_app(settings: Settings | None = None) -> FastAPI:
+def create_app(settings: Settings | SettingsSnapshot | None = None) -> FastAPI:
     settings = settings or get_settings()
     configure_logging(settings.log_level)
 
-    app = FastAPI(title="LLM Egress Guard", version=settings.model_version)
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        # Emit metrics and logs still queued for the background worker
+        await asyncio.to_thread(observability_async.flush)
+
+    app = FastAPI(title="LLM Egress Guard", version=settings.model_version, lifespan=lifespan)
     guard_semaphore = asyncio.Semaphore(settings.max_concurrent_guard_requests)
 
     @app.middleware("http")
     async def enforce_limits(request: Request, call_next):
-        if request.url.path == "/guard":
+        if request.url.path in ("/guard", "/guard/batch"):
             limit = settings.max_request_size_bytes
             content_length = request.headers.get("content-length")
             if content_length:
@@ -152,6 +169,44 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                     detail="request timeout",
                 ) from None
 
+    @app.post("/guard/batch", response_model=list[GuardResponseModel])
+    async def guard_batch_endpoint(
+        request: GuardBatchRequestModel,
+        settings: SettingsDep,
+        _: None = Depends(verify_api_key),
+    ) -> list[GuardResponseModel]:
+        # One worker-thread hop and one policy snapshot for the whole batch
+        def run_batch() -> list[GuardResponseModel]:
+            results = run_pipeline_batch(
+                (
+                    GuardRequest(
+                        response=text,
+                        policy_id=request.policy_id,
+                        metadata=request.metadata,
+                    )
+                    for text in request.responses
+                ),
+                settings=settings,
+            )
+            return [GuardResponseModel(**result.asdict()) for result in results]
+
+        async with guard_semaphore:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(run_batch),
+                    timeout=settings.request_timeout_seconds,
+                )
+            except TimeoutError:
+                _security_logger.warning(
+                    "request_timeout",
+                    path="/guard/batch",
+                    timeout_seconds=settings.request_timeout_seconds,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_408_REQUEST_TIMEOUT,
+                    detail="request timeout",
+                ) from None
+
     @app.get("/metrics")
     async def metrics_endpoint(
         settings: SettingsDep, _: None = Depends(verify_api_key)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -13,9 +12,6 @@ from prometheus_client import (
     generate_latest,
 )
 
-if TYPE_CHECKING:
-    from app.parser import ParsedContent
-
 REGISTRY = CollectorRegistry()
 
 GUARD_LATENCY = Histogram(
@@ -83,14 +79,20 @@ ML_PRECLF_SHADOW_TOTAL = Counter(
     registry=REGISTRY,
 )
 
+# Metrics/log events dropped because the background dispatch queue was full
+OBSERVABILITY_DROPPED_TOTAL = Counter(
+    "egress_guard_observability_dropped_total",
+    "Count of observability events dropped under backpressure",
+    registry=REGISTRY,
+)
+
 
-def observe_guard_run(*, latency_ms: float, findings: Sequence[Any], blocked: bool) -> None:
+def observe_guard_run(*, latency_ms: float, rule_ids: Sequence[str], blocked: bool) -> None:
     GUARD_LATENCY.observe(latency_ms / 1000.0)
     if blocked:
         BLOCKED_TOTAL.inc()
-    for finding in findings:
-        rule_id = getattr(finding, "rule_id", "unknown")
-        RULE_HITS.labels(rule_id=rule_id).inc()
+    for rule_id in rule_ids:
+        RULE_HITS.labels(rule_id=rule_id or "unknown").inc()
 
 
 def observe_detector(*, detector: str, latency_ms: float, severities: Sequence[str]) -> None:
@@ -100,16 +102,17 @@ def observe_detector(*, detector: str, latency_ms: float, severities: Sequence[s
         RULE_SEVERITY.labels(severity=key).inc()
 
 
-def observe_context(parsed_content: ParsedContent) -> None:
+def observe_context(segment_types: Sequence[str], explain_only_count: int) -> None:
     """Record context-related metrics from parsed content.
 
     Args:
-        parsed_content: Parsed content with segment information.
+        segment_types: Type of each parsed segment (text, code, link).
+        explain_only_count: Number of segments flagged as explain-only.
     """
-    for segment in parsed_content.segments:
-        CONTEXT_TYPE_TOTAL.labels(type=segment.type).inc()
-        if segment.explain_only:
-            EXPLAIN_ONLY_TOTAL.inc()
+    for segment_type in segment_types:
+        CONTEXT_TYPE_TOTAL.labels(type=segment_type).inc()
+    if explain_only_count:
+        EXPLAIN_ONLY_TOTAL.inc(explain_only_count)
 
 
 def observe_ml_preclf_load(status: str) -> None:
@@ -122,6 +125,11 @@ def observe_ml_shadow(ml_pred: str, heuristic: str, final: str) -> None:
     ML_PRECLF_SHADOW_TOTAL.labels(ml_pred=ml_pred, heuristic=heuristic, final=final).inc()
 
 
+def observe_observability_dropped() -> None:
+    """Track metrics/log events dropped by the background dispatcher."""
+    OBSERVABILITY_DROPPED_TOTAL.inc()
+
+
 def render_metrics() -> tuple[bytes, str]:
     payload = generate_latest(REGISTRY)
     return payload, CONTENT_TYPE_LATEST
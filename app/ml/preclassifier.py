@@ -13,6 +13,12 @@ import joblib
 KEYWORDS = {"curl", "wget", "powershell", "kubectl", "select", "insert", "delete"}
 TRUSTED_MODEL_DIR = Path("models").resolve()
 
+# Loaded classifiers keyed by (model, manifest, enforce_integrity), tagged with the
+# files' (st_mtime_ns, st_size) so a replaced artifact is re-verified and reloaded
+_LOADED_CACHE: dict[
+    tuple[Path, Path, bool], tuple[tuple[int, ...], PreClassifier | ModelPreClassifier]
+] = {}
+
 
 class ModelIntegrityError(Exception):
     """Raised when model integrity verification fails."""
@@ -41,11 +47,8 @@ class ModelPreClassifier:
 
 def _sha256_file(path: Path) -> str:
     """Compute SHA256 hash of a file."""
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _verify_model_integrity(model_path: Path, manifest_path: Path) -> None:
@@ -109,12 +112,35 @@ def load_preclassifier(
             f"Model path {path} is outside trusted directory {TRUSTED_MODEL_DIR}"
         ) from None
 
+    # Requests reuse the verified, unpickled model while the files are unchanged,
+    # so the per-request cost is a stat() rather than a SHA256 pass and joblib.load
+    key = (path, manifest, enforce_integrity)
+    signature = _file_signature(path)
+    if enforce_integrity and manifest.exists():
+        signature += _file_signature(manifest)
+    cached = _LOADED_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     # Integrity check before loading untrusted pickle
     if enforce_integrity:
         _verify_model_integrity(path, manifest)
 
+    classifier: PreClassifier | ModelPreClassifier
     try:
         artifact = joblib.load(path)
-        return ModelPreClassifier(name=path.name, model=artifact)
+        classifier = ModelPreClassifier(name=path.name, model=artifact)
     except Exception:
-        return PreClassifier()
+        classifier = PreClassifier()
+    _LOADED_CACHE[key] = (signature, classifier)
+    return classifier
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def clear_preclassifier_cache() -> None:
+    """Drop loaded classifiers so the next load re-verifies and re-reads the files."""
+    _LOADED_CACHE.clear()
@@ -0,0 +1,79 @@
+"""Background dispatch of metrics and log calls off the request path."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from app import metrics
+
+LOGGER = structlog.get_logger(__name__)
+
+MAX_PENDING_EVENTS = 10000
+
+# Log events are stamped by the caller, since the worker may run them much later
+_TIMESTAMPER = structlog.processors.TimeStamper(fmt="iso")
+
+_QUEUE: queue.Queue[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = queue.Queue(
+    maxsize=MAX_PENDING_EVENTS
+)
+_WORKER: threading.Thread | None = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _run() -> None:
+    while True:
+        func, args, kwargs = _QUEUE.get()
+        try:
+            func(*args, **kwargs)
+        except Exception:  # pragma: no cover - observability must never crash the worker
+            LOGGER.exception("observability.dispatch_failed", func=getattr(func, "__name__", "?"))
+        finally:
+            _QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    if _WORKER is not None and _WORKER.is_alive():
+        return
+    with _WORKER_LOCK:
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(target=_run, name="observability", daemon=True)
+            _WORKER.start()
+
+
+def submit(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Queue ``func(*args, **kwargs)`` for the background worker.
+
+    Callers should pass plain values or snapshots, not objects they keep mutating.
+    When the queue is full the event is dropped and counted rather than blocking.
+    """
+    _ensure_worker()
+    try:
+        _QUEUE.put_nowait((func, args, kwargs))
+    except queue.Full:
+        metrics.observe_observability_dropped()
+
+
+def submit_log(log_method: Callable[..., Any], event: str, **kwargs: Any) -> None:
+    """Queue a structlog call, timestamped now rather than when the worker emits it."""
+    kwargs.setdefault("timestamp", _TIMESTAMPER(None, "", {})["timestamp"])
+    submit(log_method, event, **kwargs)
+
+
+def add_timestamp(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """structlog processor that keeps a caller-bound timestamp and stamps the rest."""
+    if "timestamp" in event_dict:
+        return event_dict
+    return _TIMESTAMPER(logger, method_name, event_dict)
+
+
+def flush() -> None:
+    """Block until every queued event has been processed."""
+    if _WORKER is None:
+        return
+    _QUEUE.join()
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import copy
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from hashlib import blake2b
+from itertools import chain
+from threading import RLock
 from time import perf_counter
 from typing import Any
 
+import orjson
 import structlog
 
-from app import actions, metrics, normalize, parser, policy
-from app.settings import Settings
+from app import actions, metrics, normalize, observability_async, parser, policy
+from app.settings import Settings, SettingsSnapshot
 
 LOGGER = structlog.get_logger(__name__)
 
+# Results of identical requests (same response, policy, metadata and flags)
+# are deterministic, so retries can be answered from an in-process LRU cache.
+_PIPELINE_CACHE: OrderedDict[tuple[Any, ...], tuple[policy.PolicyStore, _CachedResult]] = (
+    OrderedDict()
+)
+_PIPELINE_CACHE_LOCK = RLock()
+
 
 @dataclass(slots=True)
 class GuardRequest:
@@ -31,6 +45,17 @@ class Finding:
     context: str = "text"  # Segment type: "text", "code", "link"
     explain_only: bool = False  # True if finding is in educational context
 
+    def asdict(self) -> dict[str, Any]:
+        # Explicit field copy; dataclasses.asdict deep-copies detail recursively
+        return {
+            "rule_id": self.rule_id,
+            "action": self.action,
+            "type": self.type,
+            "detail": dict(self.detail),
+            "context": self.context,
+            "explain_only": self.explain_only,
+        }
+
 
 @dataclass(slots=True)
 class PipelineResult:
@@ -45,7 +70,7 @@ class PipelineResult:
     def asdict(self) -> dict[str, Any]:
         return {
             "response": self.response,
-            "findings": [asdict(finding) for finding in self.findings],
+            "findings": [finding.asdict() for finding in self.findings],
             "blocked": self.blocked,
             "risk_score": self.risk_score,
             "policy_id": self.policy_id,
@@ -54,6 +79,48 @@ class PipelineResult:
         }
 
 
+def _copy_finding(finding: Finding) -> Finding:
+    return replace(finding, detail=copy.deepcopy(finding.detail))
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedResult:
+    """Snapshot of a PipelineResult whose findings are private copies.
+
+    Callers only ever receive fresh copies, so mutating a returned finding cannot
+    leak into the cache or into other requests' results.
+    """
+
+    response: str
+    findings: tuple[Finding, ...]
+    blocked: bool
+    risk_score: int
+    policy_id: str
+    version: str
+
+    @classmethod
+    def from_result(cls, result: PipelineResult) -> _CachedResult:
+        return cls(
+            response=result.response,
+            findings=tuple(_copy_finding(finding) for finding in result.findings),
+            blocked=result.blocked,
+            risk_score=result.risk_score,
+            policy_id=result.policy_id,
+            version=result.version,
+        )
+
+    def to_result(self, *, latency_ms: float) -> PipelineResult:
+        return PipelineResult(
+            response=self.response,
+            findings=[_copy_finding(finding) for finding in self.findings],
+            blocked=self.blocked,
+            risk_score=self.risk_score,
+            policy_id=self.policy_id,
+            latency_ms=latency_ms,
+            version=self.version,
+        )
+
+
 def _annotate_findings_with_context(
     findings: list[Finding],
     parsed: parser.ParsedContent,
@@ -82,7 +149,7 @@ def _validate_pii_findings(
     findings: list[Finding],
     parsed: parser.ParsedContent,
     *,
-    settings: Settings,
+    settings: Settings | SettingsSnapshot,
 ) -> list[Finding]:
     """Optionally validate PII findings with spaCy to reduce false positives."""
     if not settings.feature_ml_validator or not findings:
@@ -130,30 +197,167 @@ def _validate_pii_findings(
     return validated
 
 
-def run_pipeline(guard_request: GuardRequest, *, settings: Settings) -> PipelineResult:
+def _pipeline_cache_key(
+    guard_request: GuardRequest, *, settings: Settings | SettingsSnapshot
+) -> tuple[Any, ...] | None:
+    """Build a cache key for a request, or None if the metadata is not serializable."""
+    try:
+        metadata_blob = orjson.dumps(guard_request.metadata or {}, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+    response_digest = blake2b(
+        guard_request.response.encode("utf-8", errors="surrogatepass"), digest_size=16
+    ).digest()
+    return (
+        response_digest,
+        guard_request.policy_id,
+        blake2b(metadata_blob, digest_size=16).digest(),
+        settings.feature_ml_preclf,
+        settings.feature_ml_validator,
+        settings.feature_context_parsing,
+        settings.shadow_mode,
+        settings.allow_explain_only_bypass,
+        settings.model_version,
+    )
+
+
+def _get_cached_result(key: tuple[Any, ...], store: policy.PolicyStore) -> _CachedResult | None:
+    with _PIPELINE_CACHE_LOCK:
+        cached = _PIPELINE_CACHE.get(key)
+        if cached is None:
+            return None
+        if cached[0] is not store:
+            # Policy was reloaded since the result was computed
+            del _PIPELINE_CACHE[key]
+            return None
+        _PIPELINE_CACHE.move_to_end(key)
+        return cached[1]
+
+
+def _store_cached_result(
+    key: tuple[Any, ...],
+    store: policy.PolicyStore,
+    result: PipelineResult,
+    *,
+    max_size: int,
+) -> None:
+    snapshot = _CachedResult.from_result(result)
+    with _PIPELINE_CACHE_LOCK:
+        _PIPELINE_CACHE[key] = (store, snapshot)
+        _PIPELINE_CACHE.move_to_end(key)
+        while len(_PIPELINE_CACHE) > max_size:
+            _PIPELINE_CACHE.popitem(last=False)
+
+
+def clear_pipeline_cache() -> None:
+    """Drop all cached pipeline results."""
+
+    with _PIPELINE_CACHE_LOCK:
+        _PIPELINE_CACHE.clear()
+
+
+@dataclass(slots=True, frozen=True)
+class _BatchContext:
+    """Per-batch state resolved once and shared by every request in the batch."""
+
+    store: policy.PolicyStore
+    ml_preclassifier: Any
+
+
+def _load_ml_preclassifier(settings: Settings | SettingsSnapshot) -> Any:
+    """Load the ML pre-classifier, or return None so the parser falls back to heuristics."""
+
+    try:
+        from app.ml.preclassifier import load_preclassifier
+
+        ml_preclassifier = load_preclassifier(
+            model_path=settings.preclf_model_path,
+            manifest_path=settings.preclf_manifest_path,
+            enforce_integrity=settings.enforce_model_integrity,
+        )
+        observability_async.submit(metrics.observe_ml_preclf_load, status="success")
+        return ml_preclassifier
+    except Exception:
+        observability_async.submit(metrics.observe_ml_preclf_load, status="fail")
+        return None
+
+
+def run_pipeline(
+    guard_request: GuardRequest, *, settings: Settings | SettingsSnapshot
+) -> PipelineResult:
     """Execute the guard pipeline for a single response."""
 
+    return _run_pipeline(guard_request, settings=settings, context=None)
+
+
+def run_pipeline_batch(
+    guard_requests: Iterable[GuardRequest], *, settings: Settings | SettingsSnapshot
+) -> list[PipelineResult]:
+    """Execute the guard pipeline for several responses against one policy snapshot."""
+
+    context = _BatchContext(
+        store=policy.load_policy(
+            settings.policy_path, recheck_interval=settings.policy_recheck_interval_seconds
+        ),
+        ml_preclassifier=(_load_ml_preclassifier(settings) if settings.feature_ml_preclf else None),
+    )
+    return [
+        _run_pipeline(guard_request, settings=settings, context=context)
+        for guard_request in guard_requests
+    ]
+
+
+def _run_pipeline(
+    guard_request: GuardRequest,
+    *,
+    settings: Settings | SettingsSnapshot,
+    context: _BatchContext | None,
+) -> PipelineResult:
     start = perf_counter()
-    LOGGER.info("pipeline.start", policy_id=guard_request.policy_id)
+    observability_async.submit_log(LOGGER.info, "pipeline.start", policy_id=guard_request.policy_id)
+
+    # Resolved once: the cache lookup and the detectors must see the same snapshot
+    loaded_policy = (
+        context.store
+        if context is not None
+        else policy.load_policy(
+            settings.policy_path, recheck_interval=settings.policy_recheck_interval_seconds
+        )
+    )
+
+    cache_key: tuple[Any, ...] | None = None
+    if settings.enable_pipeline_cache and settings.pipeline_cache_size > 0:
+        cache_key = _pipeline_cache_key(guard_request, settings=settings)
+        if cache_key is not None:
+            cached_result = _get_cached_result(cache_key, loaded_policy)
+            if cached_result is not None:
+                latency_ms = (perf_counter() - start) * 1000
+                observability_async.submit(
+                    metrics.observe_guard_run,
+                    latency_ms=latency_ms,
+                    rule_ids=tuple([finding.rule_id for finding in cached_result.findings]),
+                    blocked=cached_result.blocked,
+                )
+                observability_async.submit_log(
+                    LOGGER.info,
+                    "pipeline.end",
+                    policy_id=guard_request.policy_id,
+                    blocked=cached_result.blocked,
+                    findings=len(cached_result.findings),
+                    latency_ms=latency_ms,
+                    cache_hit=True,
+                )
+                return cached_result.to_result(latency_ms=latency_ms)
 
     normalized = normalize.normalize_text(guard_request.response)
 
     # Parse content into segments for context-aware processing
     # ML pre-classifier can be passed here when available (Sprint 3)
     ml_preclassifier = None
-    if settings.feature_ml_preclf:
-        try:
-            from app.ml.preclassifier import load_preclassifier
-
-            ml_preclassifier = load_preclassifier(
-                model_path=settings.preclf_model_path,
-                manifest_path=settings.preclf_manifest_path,
-                enforce_integrity=settings.enforce_model_integrity,
-            )
-            metrics.observe_ml_preclf_load(status="success")
-        except Exception:
-            metrics.observe_ml_preclf_load(status="fail")
-            ml_preclassifier = None  # Fall back to heuristic inside parser
+    if context is not None:
+        ml_preclassifier = context.ml_preclassifier
+    elif settings.feature_ml_preclf:
+        ml_preclassifier = _load_ml_preclassifier(settings)
 
     if settings.feature_context_parsing:
         parsed = parser.parse_content(
@@ -183,10 +387,9 @@ def run_pipeline(guard_request: GuardRequest, *, settings: Settings) -> Pipeline
             metadata=guard_request.metadata or {},
         )
 
-    loaded_policy = policy.load_policy(settings.policy_path)
     policy_view = policy.select_policy(loaded_policy, guard_request.policy_id)
 
-    findings: list[Finding] = []
+    detector_outputs: list[list[Finding]] = []
     metadata = guard_request.metadata or {}
     rules_by_id = policy_view.rules_by_id
 
@@ -198,28 +401,46 @@ def run_pipeline(guard_request: GuardRequest, *, settings: Settings) -> Pipeline
         metadata=metadata,
     ):
         severities = []
+        block_hit = False
         for finding in detector_findings:
             rule = rules_by_id.get(finding.rule_id)
             if rule is not None:
                 severities.append(rule.severity)
+            if finding.action == "block":
+                block_hit = True
 
-        metrics.observe_detector(
+        observability_async.submit(
+            metrics.observe_detector,
             detector=detector_name,
             latency_ms=detector_latency,
-            severities=severities,
+            severities=tuple(severities),
         )
 
-        findings.extend(detector_findings)
-        if any(finding.action == "block" for finding in detector_findings):
+        if detector_findings:
+            detector_outputs.append(detector_findings)
+        if block_hit:
             break
 
-    findings = _validate_pii_findings(findings, parsed, settings=settings)
+    # Flatten once at the end; a single firing detector's list is reused as-is
+    findings: list[Finding] = (
+        detector_outputs[0]
+        if len(detector_outputs) == 1
+        else list(chain.from_iterable(detector_outputs))
+    )
 
-    # Annotate findings with segment context for risk adjustment
-    _annotate_findings_with_context(findings, parsed)
+    if findings:
+        findings = _validate_pii_findings(findings, parsed, settings=settings)
 
-    # Observe context metrics
-    metrics.observe_context(parsed)
+        # Annotate findings with segment context for risk adjustment
+        _annotate_findings_with_context(findings, parsed)
+
+    # Observe context metrics; the worker only gets plain values, never live objects
+    segments = parsed.segments
+    observability_async.submit(
+        metrics.observe_context,
+        tuple([segment.type for segment in segments]),
+        sum(1 for segment in segments if segment.explain_only),
+    )
 
     decision = policy.evaluate(
         policy_view,
@@ -229,17 +450,26 @@ def run_pipeline(guard_request: GuardRequest, *, settings: Settings) -> Pipeline
         allow_explain_only_bypass=settings.allow_explain_only_bypass,
     )
 
-    sanitized_text = actions.apply_actions(
-        parsed_text=parsed.text,
-        findings=findings,
-        decision=decision,
-        normalized=normalized,
-    )
+    if findings:
+        sanitized_text = actions.apply_actions(
+            parsed_text=parsed.text,
+            findings=findings,
+            decision=decision,
+            normalized=normalized,
+        )
+    else:
+        # Nothing to mask or block: clean responses pass through unchanged
+        sanitized_text = parsed.text
 
     latency_ms = (perf_counter() - start) * 1000
-    metrics.observe_guard_run(latency_ms=latency_ms, findings=findings, blocked=decision.blocked)
-
-    LOGGER.info(
+    observability_async.submit(
+        metrics.observe_guard_run,
+        latency_ms=latency_ms,
+        rule_ids=tuple([finding.rule_id for finding in findings]),
+        blocked=decision.blocked,
+    )
+    observability_async.submit_log(
+        LOGGER.info,
         "pipeline.end",
         policy_id=guard_request.policy_id,
         blocked=decision.blocked,
@@ -247,7 +477,7 @@ def run_pipeline(guard_request: GuardRequest, *, settings: Settings) -> Pipeline
         latency_ms=latency_ms,
     )
 
-    return PipelineResult(
+    result = PipelineResult(
         response=sanitized_text,
         findings=findings,
         blocked=decision.blocked,
@@ -256,3 +486,10 @@ def run_pipeline(guard_request: GuardRequest, *, settings: Settings) -> Pipeline
         latency_ms=latency_ms,
         version=settings.model_version,
     )
+
+    if cache_key is not None:
+        _store_cached_result(
+            cache_key, loaded_policy, result, max_size=settings.pipeline_cache_size
+        )
+
+    return result
@@ -2,21 +2,61 @@
 
 from __future__ import annotations
 
+import mmap
 import re
-from collections.abc import Iterable, Sequence
+import sys
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
-from threading import RLock
-from typing import TYPE_CHECKING, Any
+from threading import Lock, RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Protocol
+from weakref import WeakValueDictionary
 
 import yaml
 
+try:  # optional multi-pattern accelerator for allowlist regexes
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on the deployment
+    hyperscan = None
+
+try:  # optional filesystem watcher so cached policies need no per-request stat()
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - depends on the deployment
+    Observer = None
+
 if TYPE_CHECKING:
     from app.parser import ParsedContent
 
 DEFAULT_RULE_WEIGHT = 10
+_EMPTY_SELECTOR: frozenset[str] = frozenset()
+# libyaml-backed loader when PyYAML was built with it; pure-Python fallback otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 _POLICY_CACHE: dict[Path, tuple[float, PolicyStore]] = {}
+# Input path -> resolved path, so cache hits skip the realpath walk
+_RESOLVED_PATHS: dict[Path, Path] = {}
+_POLICY_CHECKED_AT: dict[Path, float] = {}
+_POLICY_WATCHED: set[Path] = set()
+_POLICY_DIRTY: set[Path] = set()
+_POLICY_OBSERVER: Any = None
 _POLICY_LOCK = RLock()
+# Default time a cached policy is trusted before the file mtime is checked again, so
+# hot requests skip the stat() syscall; pass 0 to load_policy() to check every call.
+POLICY_RECHECK_INTERVAL_SECONDS = 1.0
+# Compiled patterns shared across policies, tenants and reloads; entries go away
+# once no loaded policy references them any more.
+_PATTERN_CACHE: WeakValueDictionary[tuple[str, int], re.Pattern[str]] = WeakValueDictionary()
+_PATTERN_CACHE_LOCK = Lock()
+
+
+class PolicyFinding(Protocol):
+    """Fields evaluate() reads from a finding (satisfied by ``app.pipeline.Finding``)."""
+
+    rule_id: str
+    type: str
+    context: str
+    explain_only: bool
+
 
 # Default context settings for risk adjustment
 DEFAULT_CONTEXT_SETTINGS = {
@@ -33,10 +73,11 @@ class AllowlistEntry:
 
     value: str | None = None
     regex: re.Pattern[str] | None = None
-    rule_types: set[str] = field(default_factory=set)
-    rule_kinds: set[str] = field(default_factory=set)
-    rule_ids: set[str] = field(default_factory=set)
-    tenants: set[str] = field(default_factory=set)
+    # Unrestricted selectors share the module-level empty frozenset
+    rule_types: frozenset[str] | set[str] = _EMPTY_SELECTOR
+    rule_kinds: frozenset[str] | set[str] = _EMPTY_SELECTOR
+    rule_ids: frozenset[str] | set[str] = _EMPTY_SELECTOR
+    tenants: frozenset[str] | set[str] = _EMPTY_SELECTOR
 
     def matches(
         self,
@@ -62,6 +103,225 @@ class AllowlistEntry:
         return False
 
 
+@dataclass(slots=True)
+class AllowlistGroup:
+    """Allowlist entries sharing the same selectors, merged into one matcher.
+
+    Literal values become a single set lookup and compatible regexes are joined
+    into one alternation so a candidate is searched once per group.
+    """
+
+    rule_types: frozenset[str]
+    rule_kinds: frozenset[str]
+    rule_ids: frozenset[str]
+    tenants: frozenset[str]
+    values: frozenset[str] = frozenset()
+    regexes: tuple[re.Pattern[str], ...] = ()
+    scanner: HyperscanMatcher | None = None
+    predicate: Callable[[str, str, str | None, str, str | None], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.predicate = _compile_group_predicate(self)
+
+    def matches(
+        self,
+        candidate: str,
+        *,
+        rule_type: str,
+        rule_kind: str | None,
+        rule_id: str,
+        tenant: str | None,
+    ) -> bool:
+        return self.predicate(candidate, rule_type, rule_kind, rule_id, tenant)
+
+
+def _compile_group_predicate(
+    group: AllowlistGroup,
+) -> Callable[[str, str, str | None, str, str | None], bool]:
+    """Build a predicate closed over only the checks this group needs.
+
+    Empty selectors and missing matcher kinds are resolved at build time, so the
+    per-candidate call skips them without re-inspecting the group.
+    """
+    # None never appears in the selector sets, so a None kind/tenant fails its check
+    rule_types = group.rule_types or None
+    rule_kinds = group.rule_kinds or None
+    rule_ids = group.rule_ids or None
+    tenants = group.tenants or None
+
+    searches: list[Callable[[str], Any]] = []
+    if group.values:
+        searches.append(group.values.__contains__)
+    if group.scanner is not None:
+        searches.append(group.scanner.search)
+    else:
+        searches.extend(regex.search for regex in group.regexes)
+
+    if not searches:
+
+        def predicate(
+            candidate: str,
+            rule_type: str,
+            rule_kind: str | None,
+            rule_id: str,
+            tenant: str | None,
+        ) -> bool:
+            return False
+
+        return predicate
+
+    def predicate(
+        candidate: str,
+        rule_type: str,
+        rule_kind: str | None,
+        rule_id: str,
+        tenant: str | None,
+    ) -> bool:
+        if rule_types is not None and rule_type not in rule_types:
+            return False
+        if rule_kinds is not None and rule_kind not in rule_kinds:
+            return False
+        if rule_ids is not None and rule_id not in rule_ids:
+            return False
+        if tenants is not None and tenant not in tenants:
+            return False
+        for search in searches:
+            if search(candidate):
+                return True
+        return False
+
+    return predicate
+
+
+class HyperscanMatcher:
+    """Linear-time multi-pattern search over a group's regexes using Hyperscan."""
+
+    __slots__ = ("_database", "_lock")
+
+    def __init__(self, database: Any) -> None:
+        self._database = database
+        # A database has a single scratch space, so scans must not overlap
+        self._lock = Lock()
+
+    def search(self, candidate: str) -> bool:
+        matched = False
+
+        def _on_match(*_: Any) -> bool:
+            nonlocal matched
+            matched = True
+            return True  # stop at the first hit
+
+        with self._lock:
+            try:
+                self._database.scan(candidate.encode("utf-8"), match_event_handler=_on_match)
+            except hyperscan.error:
+                # Halting the scan from the handler surfaces as a scan error
+                if not matched:
+                    raise
+        return matched
+
+
+_HYPERSCAN_SUPPORTED_FLAGS = re.IGNORECASE | re.DOTALL | re.MULTILINE | re.UNICODE
+
+
+def _build_hyperscan_matcher(patterns: list[re.Pattern[str]]) -> HyperscanMatcher | None:
+    """Compile patterns into one Hyperscan database, or None to keep using ``re``."""
+    if hyperscan is None or not patterns:
+        return None
+    if any(pattern.flags & ~_HYPERSCAN_SUPPORTED_FLAGS for pattern in patterns):
+        return None
+
+    flags: list[int] = []
+    for pattern in patterns:
+        hs_flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        if pattern.flags & re.IGNORECASE:
+            hs_flags |= hyperscan.HS_FLAG_CASELESS
+        if pattern.flags & re.DOTALL:
+            hs_flags |= hyperscan.HS_FLAG_DOTALL
+        if pattern.flags & re.MULTILINE:
+            hs_flags |= hyperscan.HS_FLAG_MULTILINE
+        flags.append(hs_flags)
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[pattern.pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags,
+        )
+    except hyperscan.error:
+        # Constructs Hyperscan does not support (backreferences, lookaround, ...)
+        return None
+    return HyperscanMatcher(database)
+
+
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile ``pattern`` or return the instance already shared by another policy."""
+    key = (pattern, flags)
+    compiled = _PATTERN_CACHE.get(key)
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+        with _PATTERN_CACHE_LOCK:
+            compiled = _PATTERN_CACHE.setdefault(key, compiled)
+    return compiled
+
+
+def _combine_regexes(patterns: list[re.Pattern[str]]) -> tuple[re.Pattern[str], ...]:
+    """Join patterns into one alternation when that cannot change their meaning."""
+    if len(patterns) < 2:
+        return tuple(patterns)
+    flags = patterns[0].flags
+    # Capturing groups would renumber backreferences; differing flags cannot be merged
+    if any(pattern.groups or pattern.flags != flags for pattern in patterns):
+        return tuple(patterns)
+    try:
+        combined = _compile_pattern(
+            "|".join(f"(?:{pattern.pattern})" for pattern in patterns), flags
+        )
+    except re.error:
+        # e.g. inline global flags such as "(?i)" are only valid at the start
+        return tuple(patterns)
+    return (combined,)
+
+
+def _group_allowlist(entries: Sequence[AllowlistEntry]) -> list[AllowlistGroup]:
+    buckets: dict[
+        tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]],
+        tuple[set[str], list[re.Pattern[str]]],
+    ] = {}
+    for entry in entries:
+        key = (
+            frozenset(entry.rule_types),
+            frozenset(entry.rule_kinds),
+            frozenset(entry.rule_ids),
+            frozenset(entry.tenants),
+        )
+        values, regexes = buckets.setdefault(key, (set(), []))
+        if entry.value is not None:
+            values.add(entry.value)
+        if entry.regex is not None:
+            regexes.append(entry.regex)
+
+    groups: list[AllowlistGroup] = []
+    for (rule_types, rule_kinds, rule_ids, tenants), (values, regexes) in buckets.items():
+        scanner = _build_hyperscan_matcher(regexes)
+        groups.append(
+            AllowlistGroup(
+                rule_types=rule_types,
+                rule_kinds=rule_kinds,
+                rule_ids=rule_ids,
+                tenants=tenants,
+                values=frozenset(values),
+                regexes=() if scanner is not None else _combine_regexes(regexes),
+                scanner=scanner,
+            )
+        )
+    return groups
+
+
 @dataclass(slots=True)
 class PolicyRule:
     """A single policy rule."""
@@ -74,36 +334,116 @@ class PolicyRule:
     severity: str = "medium"
     risk_weight: int = DEFAULT_RULE_WEIGHT
     safe_message: str | None = None
+    compiled_pattern: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # risk_weight clamped at zero, the value evaluate() actually scores with
+    base_weight: int = field(default=0, init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Compiled once per rule so every scan shares the same pattern object
+        if self.pattern:
+            self.compiled_pattern = _compile_pattern(self.pattern, re.IGNORECASE)
+        self.base_weight = max(self.risk_weight, 0)
 
-@dataclass(slots=True)
+
+@dataclass(frozen=True, slots=True)
 class ContextSettings:
-    """Settings for context-based risk adjustment."""
+    """Settings for context-based risk adjustment.
+
+    Frozen so the memoized deltas can never disagree with the weights.
+    """
 
     enabled: bool = True
     code_block_penalty: int = 15
     explain_only_penalty: int = 25
     link_context_bonus: int = 5
+    # (context, finding_type, explain_only) -> risk delta, filled on first use
+    _deltas: dict[tuple[str, str, bool], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def delta(self, context: str, finding_type: str, explain_only: bool) -> int:
+        """Return the risk adjustment for a finding's context combination."""
+        key = (context, finding_type, explain_only)
+        cached = self._deltas.get(key)
+        if cached is None:
+            cached = self._deltas[key] = self._compute_delta(context, finding_type, explain_only)
+        return cached
+
+    def _compute_delta(self, context: str, finding_type: str, explain_only: bool) -> int:
+        if not self.enabled:
+            return 0
+        delta = 0
+        # Explain-only penalty (strongest reduction); only for commands so real
+        # PII/secrets are never masked by an educational framing
+        if explain_only and finding_type == "cmd":
+            delta -= self.explain_only_penalty
+        # Code block penalty (code is often educational/example); don't double-penalize
+        if context == "code" and not explain_only:
+            delta -= self.code_block_penalty
+        # Link context bonus (clickable URLs are higher risk)
+        if context == "link" and finding_type == "url":
+            delta += self.link_context_bonus
+        return delta
 
 
 @dataclass(slots=True)
 class PolicyDefinition:
-    """A materialized policy ready for evaluation."""
+    """A materialized policy ready for evaluation.
+
+    ``rules`` and ``allowlist`` are stored as tuples and indexed once at
+    construction; build a new definition rather than changing them in place.
+    """
 
     policy_id: str
     tiers: str
-    allowlist: list[AllowlistEntry] = field(default_factory=list)
-    rules: list[PolicyRule] = field(default_factory=list)
+    allowlist: tuple[AllowlistEntry, ...] = ()
+    rules: tuple[PolicyRule, ...] = ()
     context_settings: ContextSettings = field(default_factory=ContextSettings)
+    allowlist_groups: list[AllowlistGroup] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    rules_by_id: dict[str, PolicyRule] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    rules_by_type: dict[str, list[PolicyRule]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Groups that can apply to a rule type; types without an entry fall back to
+    # the groups that are not restricted by type at all.
+    allowlist_by_type: dict[str, list[AllowlistGroup]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    allowlist_any_type: list[AllowlistGroup] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
-    def iter_rules(self, rule_type: str) -> Iterable[PolicyRule]:
+    def __post_init__(self) -> None:
+        # Accept any sequence, but freeze it so the lookups below cannot go stale
+        self.allowlist = tuple(self.allowlist)
+        self.rules = tuple(self.rules)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        self.allowlist_groups = _group_allowlist(self.allowlist)
+        self.allowlist_any_type = [group for group in self.allowlist_groups if not group.rule_types]
+        self.allowlist_by_type = {
+            rule_type: [
+                group
+                for group in self.allowlist_groups
+                if not group.rule_types or rule_type in group.rule_types
+            ]
+            for rule_type in {t for group in self.allowlist_groups for t in group.rule_types}
+        }
+        self.rules_by_id = {rule.id: rule for rule in self.rules}
+        rules_by_type: dict[str, list[PolicyRule]] = {}
         for rule in self.rules:
-            if rule.type == rule_type:
-                yield rule
+            rules_by_type.setdefault(rule.type, []).append(rule)
+        self.rules_by_type = rules_by_type
 
-    @property
-    def rules_by_id(self) -> dict[str, PolicyRule]:
-        return {rule.id: rule for rule in self.rules}
+    def iter_rules(self, rule_type: str) -> Iterable[PolicyRule]:
+        return iter(self.rules_by_type.get(rule_type, ()))
 
     def is_allowlisted(
         self,
@@ -112,14 +452,10 @@ class PolicyDefinition:
         rule: PolicyRule,
         tenant: str | None = None,
     ) -> bool:
-        for entry in self.allowlist:
-            if entry.matches(
-                candidate,
-                rule_type=rule.type,
-                rule_kind=rule.kind,
-                rule_id=rule.id,
-                tenant=tenant,
-            ):
+        rule_type, rule_kind, rule_id = rule.type, rule.kind, rule.id
+        groups = self.allowlist_by_type.get(rule_type, self.allowlist_any_type)
+        for group in groups:
+            if group.predicate(candidate, rule_type, rule_kind, rule_id, tenant):
                 return True
         return False
 
@@ -133,19 +469,19 @@ class PolicyStore:
 class PolicyDecision:
     blocked: bool
     risk_score: int
-    applied_rules: list[str] = field(default_factory=list)
+    applied_rules: tuple[str, ...] = ()
     safe_message_key: str | None = None
 
 
 def _parse_allowlist(
     entries: Sequence[Any],
     *,
-    default_tenants: set[str] | None = None,
+    default_tenants: frozenset[str] | None = None,
 ) -> list[AllowlistEntry]:
     parsed: list[AllowlistEntry] = []
     for raw in entries:
         if isinstance(raw, str):
-            parsed.append(AllowlistEntry(value=raw, tenants=set(default_tenants or set())))
+            parsed.append(AllowlistEntry(value=raw, tenants=default_tenants or _EMPTY_SELECTOR))
             continue
         if not isinstance(raw, dict):
             raise ValueError(f"Unsupported allowlist entry type: {type(raw)!r}")
@@ -155,13 +491,23 @@ def _parse_allowlist(
         if value is None and regex_expr is None:
             raise ValueError("Allowlist entry must define either 'value' or 'regex'")
 
-        compiled = re.compile(regex_expr, re.IGNORECASE) if regex_expr else None
+        compiled = _compile_pattern(regex_expr, re.IGNORECASE) if regex_expr else None
         rule_types = _ensure_set(raw.get("types"))
         rule_kinds = _ensure_set(raw.get("kinds"))
         rule_ids = _ensure_set(raw.get("rule_ids"))
         tenants = _ensure_set(raw.get("tenants"))
+        # Only an absent selector means "any"; an explicitly empty one (``types: []``)
+        # matches no finding, so the entry can never apply
+        selectors = {
+            "types": rule_types,
+            "kinds": rule_kinds,
+            "rule_ids": rule_ids,
+            "tenants": tenants,
+        }
+        if any(raw.get(key) is not None and not selector for key, selector in selectors.items()):
+            continue
         if default_tenants:
-            tenants |= default_tenants
+            tenants = tenants | default_tenants
 
         parsed.append(
             AllowlistEntry(
@@ -176,12 +522,16 @@ def _parse_allowlist(
     return parsed
 
 
-def _ensure_set(value: Any) -> set[str]:
+def _ensure_set(value: Any) -> frozenset[str]:
+    # Members are interned to share the rule attribute strings they are compared to
     if value is None:
-        return set()
+        return _EMPTY_SELECTOR
     if isinstance(value, str):
-        return {value}
-    return {str(item) for item in value}
+        return frozenset((sys.intern(value),))
+    if isinstance(value, list | tuple) and all(type(item) is str for item in value):
+        # Common YAML case: build the set in C without re-casting each item
+        return frozenset(map(sys.intern, value))
+    return frozenset(sys.intern(str(item)) for item in value)
 
 
 def _collect_allowlist_entries(content: dict[str, Any]) -> list[AllowlistEntry]:
@@ -209,27 +559,90 @@ def _collect_allowlist_entries(content: dict[str, Any]) -> list[AllowlistEntry]:
                 entries_list = list(tenant_entries)
             else:
                 entries_list = [tenant_entries]
-            combined.extend(_parse_allowlist(entries_list, default_tenants={str(tenant)}))
+            combined.extend(
+                _parse_allowlist(
+                    entries_list, default_tenants=frozenset((sys.intern(str(tenant)),))
+                )
+            )
     else:
         raise ValueError("tenant_allowlist must be a mapping of tenant -> entries")
 
     return combined
 
 
-def load_policy(path: Path, *, use_cache: bool = True) -> PolicyStore:
+def _read_yaml(path: Path) -> Any:
+    """Parse a YAML file straight from a read-only mapping of its bytes.
+
+    Avoids materializing the file as a ``str`` before the (C) loader decodes it.
+    """
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None
+        with mapped:
+            madvise = getattr(mapped, "madvise", None)
+            advice = getattr(mmap, "MADV_POPULATE_READ", getattr(mmap, "MADV_SEQUENTIAL", None))
+            if madvise is not None and advice is not None:
+                madvise(advice)
+            return yaml.load(mapped, Loader=_YAML_LOADER)
+
+
+def load_policy(
+    path: Path, *, use_cache: bool = True, recheck_interval: float | None = None
+) -> PolicyStore:
+    if recheck_interval is None:
+        recheck_interval = POLICY_RECHECK_INTERVAL_SECONDS
+    now = monotonic()
+
+    if use_cache:
+        # Hit path is lock-free and syscall-free: single dict/set reads are atomic
+        # under the GIL and entries are only ever replaced whole, so a hit never sees
+        # a partial store.
+        resolved = _RESOLVED_PATHS.get(path)
+        cached = _POLICY_CACHE.get(resolved) if resolved is not None else None
+        if cached:
+            if resolved in _POLICY_WATCHED:
+                # Filesystem events mark the file dirty; until then no stat() is needed
+                if resolved not in _POLICY_DIRTY:
+                    return cached[1]
+            else:
+                checked_at = _POLICY_CHECKED_AT.get(resolved)
+                if checked_at is not None and now - checked_at < recheck_interval:
+                    return cached[1]
+
+    # Resolved again on every miss or recheck so a retargeted symlink is followed
     resolved = path.resolve()
+    if use_cache:
+        _RESOLVED_PATHS[path] = resolved
+        # Clear before reading so writes that land mid-load mark it dirty again
+        _POLICY_DIRTY.discard(resolved)
+
     try:
         mtime = resolved.stat().st_mtime
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"Policy file {resolved} not found") from exc
 
+    if use_cache:
+        cached = _POLICY_CACHE.get(resolved)
+        if cached and cached[0] == mtime:
+            _POLICY_CHECKED_AT[resolved] = now
+            return cached[1]
+
+    store = _parse_policy_file(resolved)
+
     if use_cache:
         with _POLICY_LOCK:
-            cached = _POLICY_CACHE.get(resolved)
-            if cached and cached[0] == mtime:
-                return cached[1]
+            _POLICY_CACHE[resolved] = (mtime, store)
+            _POLICY_CHECKED_AT[resolved] = now
+        _watch_policy_file(resolved)
+
+    return store
 
-    data = yaml.safe_load(resolved.read_text(encoding="utf-8"))
+
+def _parse_policy_file(resolved: Path) -> PolicyStore:
+    data = _read_yaml(resolved)
     if data is None:
         raise ValueError(f"Policy file {resolved} is empty")
 
@@ -245,12 +658,15 @@ def load_policy(path: Path, *, use_cache: bool = True) -> PolicyStore:
 
         rules = [
             PolicyRule(
-                id=rule["id"],
-                type=rule["type"],
-                action=rule["action"],
-                kind=rule.get("kind"),
+                # Interned so findings built from this rule share one string object;
+                # `rules_by_id` lookups and `finding.action == "block"` checks then hit
+                # the identity fast path
+                id=sys.intern(str(rule["id"])),
+                type=sys.intern(str(rule["type"])),
+                action=sys.intern(str(rule["action"])),
+                kind=sys.intern(str(rule["kind"])) if rule.get("kind") is not None else None,
                 pattern=rule.get("pattern"),
-                severity=rule.get("severity", "medium"),
+                severity=sys.intern(str(rule.get("severity", "medium"))),
                 risk_weight=int(rule.get("risk_weight", rule.get("weight", DEFAULT_RULE_WEIGHT))),
                 safe_message=rule.get("safe_message"),
             )
@@ -286,13 +702,40 @@ def load_policy(path: Path, *, use_cache: bool = True) -> PolicyStore:
             context_settings=context_settings,
         )
 
-    store = PolicyStore(definitions=definitions)
+    return PolicyStore(definitions=definitions)
 
-    if use_cache:
+
+class _PolicyEventHandler:
+    """watchdog handler marking watched policy files dirty on any change."""
+
+    def dispatch(self, event: Any) -> None:
+        paths = (getattr(event, "src_path", None), getattr(event, "dest_path", None))
         with _POLICY_LOCK:
-            _POLICY_CACHE[resolved] = (mtime, store)
+            for raw in paths:
+                if raw and Path(raw) in _POLICY_WATCHED:
+                    _POLICY_DIRTY.add(Path(raw))
 
-    return store
+
+def _watch_policy_file(resolved: Path) -> None:
+    """Invalidate ``resolved`` from filesystem events when watchdog is installed."""
+    global _POLICY_OBSERVER
+
+    if Observer is None:
+        return
+    with _POLICY_LOCK:
+        if resolved in _POLICY_WATCHED:
+            return
+        try:
+            if _POLICY_OBSERVER is None:
+                observer = Observer()
+                observer.daemon = True
+                observer.start()
+                _POLICY_OBSERVER = observer
+            _POLICY_OBSERVER.schedule(_PolicyEventHandler(), str(resolved.parent))
+        except OSError:
+            # e.g. inotify watch limit reached; keep the mtime/TTL fallback
+            return
+        _POLICY_WATCHED.add(resolved)
 
 
 def select_policy(store: PolicyStore, policy_id: str) -> PolicyDefinition:
@@ -302,7 +745,7 @@ def select_policy(store: PolicyStore, policy_id: str) -> PolicyDefinition:
 
 
 def _apply_context_adjustment(
-    finding: Any,
+    finding: PolicyFinding,
     base_risk: int,
     context_settings: ContextSettings,
 ) -> int:
@@ -319,23 +762,9 @@ def _apply_context_adjustment(
     if not context_settings.enabled:
         return base_risk
 
-    adjusted = base_risk
-    context = getattr(finding, "context", "text")
-    explain_only = getattr(finding, "explain_only", False)
-    finding_type = getattr(finding, "type", "")
-
-    # Apply explain-only penalty (strongest reduction)
-    # Only apply to command-type findings to avoid masking real PII/secrets
-    if explain_only and finding_type == "cmd":
-        adjusted -= context_settings.explain_only_penalty
-
-    # Apply code block penalty (code is often educational/example)
-    if context == "code" and not explain_only:  # Don't double-penalize
-        adjusted -= context_settings.code_block_penalty
-
-    # Apply link context bonus (clickable URLs are higher risk)
-    if context == "link" and finding_type == "url":
-        adjusted += context_settings.link_context_bonus
+    adjusted = base_risk + context_settings.delta(
+        finding.context, finding.type, finding.explain_only
+    )
 
     # Ensure minimum of 0 for individual findings
     return max(adjusted, 0)
@@ -344,7 +773,7 @@ def _apply_context_adjustment(
 def evaluate(
     policy_def: PolicyDefinition,
     *,
-    findings: list[Any],
+    findings: Sequence[PolicyFinding],
     metadata: dict[str, Any] | None = None,
     parsed_content: ParsedContent | None = None,
     allow_explain_only_bypass: bool = False,
@@ -366,33 +795,36 @@ def evaluate(
     del metadata  # reserved for future use
     del parsed_content  # context info is already in findings
 
+    if not findings:
+        return PolicyDecision(blocked=False, risk_score=0)
+
     blocked = False
-    applied_rules: list[str] = []
     safe_message_key: str | None = None
     risk_score = 0
 
     rules_by_id = policy_def.rules_by_id
     context_settings = policy_def.context_settings
 
-    for finding in findings:
-        rule_id = getattr(finding, "rule_id", "?")
-        applied_rules.append(rule_id)
+    # Resolve ids and rules up front in C-level passes; findings without a
+    # matching rule only contribute the default weight.
+    # A list comprehension sizes the tuple exactly; tuple(<genexpr>) grows it item by item
+    applied_rules = tuple([finding.rule_id for finding in findings])
+    matched_rules = list(map(rules_by_id.get, applied_rules))
+    risk_score += DEFAULT_RULE_WEIGHT * matched_rules.count(None)
 
-        rule = rules_by_id.get(rule_id)
+    for finding, rule in zip(findings, matched_rules, strict=True):
         if rule is None:
-            risk_score += DEFAULT_RULE_WEIGHT
             continue
 
         # Apply context-based risk adjustment
-        base_weight = max(rule.risk_weight, 0)
-        adjusted_weight = _apply_context_adjustment(finding, base_weight, context_settings)
+        adjusted_weight = _apply_context_adjustment(finding, rule.base_weight, context_settings)
         risk_score += adjusted_weight
 
         # Block decisions can be downgraded for educational/explain-only content
         # ONLY if allow_explain_only_bypass is explicitly enabled (opt-in)
         if rule.action == "block":
-            explain_only = getattr(finding, "explain_only", False)
-            finding_type = getattr(finding, "type", "")
+            explain_only = finding.explain_only
+            finding_type = finding.type
 
             # Explain-only bypass is opt-in only (OWASP A04 hardening)
             if allow_explain_only_bypass and explain_only:
@@ -410,6 +842,11 @@ def evaluate(
         elif rule.safe_message and safe_message_key is None:
             safe_message_key = rule.safe_message
 
+        # Saturated: remaining findings cannot change blocked, the clamped score,
+        # or an already chosen safe message (applied_rules is precomputed)
+        if blocked and risk_score >= 100 and safe_message_key is not None:
+            break
+
     risk_score = min(risk_score, 100)
 
     if blocked and safe_message_key is None:
@@ -428,6 +865,11 @@ def invalidate_policy_cache(path: Path | None = None) -> None:
 
     with _POLICY_LOCK:
         if path is None:
+            _RESOLVED_PATHS.clear()
             _POLICY_CACHE.clear()
+            _POLICY_CHECKED_AT.clear()
         else:
-            _POLICY_CACHE.pop(path.resolve(), None)
+            _RESOLVED_PATHS.pop(path, None)
+            resolved = path.resolve()
+            _POLICY_CACHE.pop(resolved, None)
+            _POLICY_CHECKED_AT.pop(resolved, None)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
@@ -17,6 +18,10 @@ class Settings(BaseSettings):
     log_level: str = Field(default="info", alias="LOG_LEVEL")
     metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
     model_version: str = Field(default="0.2.0", alias="MODEL_VERSION")
+    # Seconds a cached policy is reused before its mtime is rechecked; 0 checks every request
+    policy_recheck_interval_seconds: float = Field(
+        default=1.0, ge=0, alias="POLICY_RECHECK_INTERVAL_SECONDS"
+    )
 
     # Feature flags
     feature_ml_preclf: bool = Field(default=True, alias="FEATURE_ML_PRECLF")
@@ -24,6 +29,10 @@ class Settings(BaseSettings):
     feature_context_parsing: bool = Field(default=True, alias="FEATURE_CONTEXT_PARSING")
     shadow_mode: bool = Field(default=False, alias="SHADOW_MODE")
 
+    # Result cache for repeated identical requests (e.g. gateway retries)
+    enable_pipeline_cache: bool = Field(default=False, alias="ENABLE_PIPELINE_CACHE")
+    pipeline_cache_size: int = Field(default=2048, alias="PIPELINE_CACHE_SIZE")
+
     # Security & Auth (OWASP A01/A05)
     require_api_key: bool = Field(default=False, alias="REQUIRE_API_KEY")
     api_key: str | None = Field(default=None, alias="API_KEY")
@@ -55,8 +64,46 @@ class Settings(BaseSettings):
     def policy_path(self) -> Path:
         return self.policy_file
 
+    def snapshot(self) -> SettingsSnapshot:
+        """Return a frozen, slotted copy of the validated values."""
+        return SettingsSnapshot(**{name: getattr(self, name) for name in type(self).model_fields})
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """Immutable mirror of Settings for the request path.
+
+    Plain slot reads, no pydantic model machinery, and safe to share across worker
+    threads. Fields must match ``Settings`` one for one.
+    """
+
+    policy_file: Path
+    log_level: str
+    metrics_enabled: bool
+    model_version: str
+    policy_recheck_interval_seconds: float
+    feature_ml_preclf: bool
+    feature_ml_validator: bool
+    feature_context_parsing: bool
+    shadow_mode: bool
+    enable_pipeline_cache: bool
+    pipeline_cache_size: int
+    require_api_key: bool
+    api_key: str | None
+    max_concurrent_guard_requests: int
+    max_request_size_bytes: int
+    request_timeout_seconds: float
+    preclf_model_path: Path
+    preclf_manifest_path: Path
+    enforce_model_integrity: bool
+    allow_explain_only_bypass: bool
+
+    @property
+    def policy_path(self) -> Path:
+        return self.policy_file
+
 
 @lru_cache(maxsize=1)
-def get_settings() -> Settings:
-    """Return a cached Settings instance."""
-    return Settings()
+def get_settings() -> SettingsSnapshot:
+    """Return a cached, frozen snapshot of the environment-driven settings."""
+    return Settings().snapshot()
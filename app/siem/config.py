@@ -6,6 +6,7 @@ Supports configuration via environment variables or direct instantiation.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from enum import Enum
 from typing import Literal
 
@@ -56,8 +57,12 @@ class SIEMConfig(BaseSettings):
         SIEM_BATCH_SIZE: Events to batch before sending (default: 10)
         SIEM_FLUSH_INTERVAL: Seconds between flushes (default: 5)
         SIEM_RETRY_COUNT: Number of retries on failure (default: 3)
-        SIEM_RETRY_DELAY: Seconds between retries (default: 1)
+        SIEM_RETRY_DELAY: Base seconds between retries (default: 1)
+        SIEM_RETRY_MAX_DELAY: Upper bound on the jittered retry delay (default: 30)
         SIEM_TIMEOUT: Request timeout in seconds (default: 10)
+        SIEM_COMPACT_KEYS: Send short key aliases to cut payload size (default: false);
+            Elasticsearch expands them with an ingest pipeline, other receivers must
+            map them back themselves
     """
 
     # General
@@ -94,8 +99,12 @@ class SIEMConfig(BaseSettings):
     flush_interval: float = Field(default=5.0, alias="SIEM_FLUSH_INTERVAL", ge=0.1)
     retry_count: int = Field(default=3, alias="SIEM_RETRY_COUNT", ge=0, le=10)
     retry_delay: float = Field(default=1.0, alias="SIEM_RETRY_DELAY", ge=0.1)
+    retry_max_delay: float = Field(default=30.0, alias="SIEM_RETRY_MAX_DELAY", ge=0.1)
     timeout: float = Field(default=10.0, alias="SIEM_TIMEOUT", ge=1.0)
 
+    # Payload
+    compact_keys: bool = Field(default=False, alias="SIEM_COMPACT_KEYS")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -104,27 +113,24 @@ class SIEMConfig(BaseSettings):
 
     def validate_config(self) -> list[str]:
         """Validate configuration for the selected connector type."""
-        errors = []
+        return list(self._iter_errors())
 
+    def _iter_errors(self) -> Iterator[str]:
         if not self.enabled:
-            return errors
+            return
 
         if self.connector_type == ConnectorType.SPLUNK:
             if not self.splunk_url:
-                errors.append("SIEM_SPLUNK_URL is required for Splunk connector")
+                yield "SIEM_SPLUNK_URL is required for Splunk connector"
             if not self.splunk_token:
-                errors.append("SIEM_SPLUNK_TOKEN is required for Splunk connector")
+                yield "SIEM_SPLUNK_TOKEN is required for Splunk connector"
 
         elif self.connector_type == ConnectorType.ELASTICSEARCH:
             if not self.elastic_url:
-                errors.append("SIEM_ELASTIC_URL is required for Elasticsearch connector")
+                yield "SIEM_ELASTIC_URL is required for Elasticsearch connector"
             if not self.elastic_api_key and not (self.elastic_username and self.elastic_password):
-                errors.append(
-                    "SIEM_ELASTIC_API_KEY or username/password required for Elasticsearch"
-                )
+                yield "SIEM_ELASTIC_API_KEY or username/password required for Elasticsearch"
 
         elif self.connector_type == ConnectorType.WEBHOOK:
             if not self.webhook_url:
-                errors.append("SIEM_WEBHOOK_URL is required for Webhook connector")
-
-        return errors
+                yield "SIEM_WEBHOOK_URL is required for Webhook connector"
@@ -10,22 +10,138 @@ Implementations for different SIEM systems:
 from __future__ import annotations
 
 import asyncio
-import json
+import random
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 
 from app.siem.config import SIEMConfig
 
+try:  # optional HTTP/2 support so concurrent batches can share one connection
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the deployment
+    _HTTP2_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Sized for the manager's concurrent batch sends; idle connections stay warm
+# between flushes so steady traffic does not pay a TLS handshake per batch.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# Client errors worth retrying; other 4xx responses will not succeed on resend
+_RETRIABLE_CLIENT_ERRORS = frozenset({408, 429})
+
+# Short aliases used when SIEM_COMPACT_KEYS is enabled; the timestamp keeps its
+# name because receivers index on it before any expansion runs.
+COMPACT_KEYS = {
+    "event_type": "e",
+    "rule_id": "r",
+    "action": "a",
+    "severity": "s",
+    "request_id": "q",
+    "tenant": "t",
+    "risk_score": "k",
+    "snippet_hash": "h",
+}
+# Metadata keys that collide with an alias are sent as ``meta_<key>`` instead, so
+# receivers never mistake them for (or expand them into) a core field.
+_COMPACT_ALIASES = frozenset(COMPACT_KEYS.values())
+_COMPACT_COLLISION_PREFIX = "meta_"
+
+_BULK_NO_ERRORS = b'"errors":false'
+
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes (orjson, UTC datetimes)."""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Like ``_dumps`` with the NDJSON newline written by orjson itself (no extra copy)."""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+
+class _FragmentStream:
+    """Request body streaming pre-encoded fragments without joining them first.
+
+    Re-iterable, so each retry attempt sends the full body again. Fragments are
+    coalesced into writes of about ``chunk_size`` bytes to avoid one socket write
+    per event. The exact length is known up front, so no chunked encoding is needed.
+    """
+
+    __slots__ = ("_fragments", "_separator", "_prefix", "_suffix", "_chunk_size")
+
+    def __init__(
+        self,
+        fragments: list[bytes],
+        *,
+        separator: bytes = b"",
+        prefix: bytes = b"",
+        suffix: bytes = b"",
+        chunk_size: int = 64 * 1024,
+    ):
+        self._fragments = fragments
+        self._separator = separator
+        self._prefix = prefix
+        self._suffix = suffix
+        self._chunk_size = chunk_size
+
+    @property
+    def content_length(self) -> int:
+        separators = len(self._separator) * max(len(self._fragments) - 1, 0)
+        return len(self._prefix) + sum(map(len, self._fragments)) + separators + len(self._suffix)
+
+    def headers(self, base: dict[str, str]) -> dict[str, str]:
+        return {**base, "Content-Length": str(self.content_length)}
+
+    async def __aiter__(self):
+        buffer = bytearray(self._prefix)
+        separator = self._separator
+        for index, fragment in enumerate(self._fragments):
+            if index and separator:
+                buffer += separator
+            buffer += fragment
+            if len(buffer) >= self._chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += self._suffix
+        if buffer:
+            yield bytes(buffer)
+
 
 class SIEMEvent:
     """A security event to send to SIEM."""
 
+    # One instance per finding and up to MAX_QUEUE_SIZE queued: no per-instance __dict__
+    __slots__ = (
+        "epoch",
+        "timestamp",
+        "event_type",
+        "rule_id",
+        "action",
+        "severity",
+        "request_id",
+        "tenant",
+        "risk_score",
+        "snippet_hash",
+        "metadata",
+        "_dict_cache",
+        "_json_bytes",
+    )
+
     def __init__(
         self,
         event_type: str,
@@ -38,7 +154,10 @@ class SIEMEvent:
         snippet_hash: str | None = None,
         metadata: dict[str, Any] | None = None,
     ):
-        self.timestamp = datetime.utcnow().isoformat() + "Z"
+        now = datetime.now(UTC)
+        # Epoch seconds kept alongside the ISO string so Splunk need not reparse it
+        self.epoch = now.timestamp()
+        self.timestamp = now.isoformat().replace("+00:00", "Z")
         self.event_type = event_type
         self.rule_id = rule_id
         self.action = action
@@ -48,9 +167,26 @@ class SIEMEvent:
         self.risk_score = risk_score
         self.snippet_hash = snippet_hash
         self.metadata = metadata or {}
+        # Events are not modified after construction, so both forms are memoized
+        self._dict_cache: dict[str, Any] | None = None
+        self._json_bytes: bytes | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert event to dictionary."""
+        """Convert event to dictionary.
+
+        The returned dict is cached and shared; copy it before modifying.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def to_json(self) -> bytes:
+        """JSON encoding of ``to_dict()``, computed once."""
+        if self._json_bytes is None:
+            self._json_bytes = _dumps(self.to_dict())
+        return self._json_bytes
+
+    def _build_dict(self) -> dict[str, Any]:
         return {
             "timestamp": self.timestamp,
             "event_type": self.event_type,
@@ -71,6 +207,11 @@ class BaseSIEMConnector(ABC):
     def __init__(self, config: SIEMConfig):
         self.config = config
         self._client: httpx.AsyncClient | None = None
+        self._headers: dict[str, str] | None = None
+        # Basic auth for connectors that use it, sent with every request
+        self._auth: tuple[str, str] | None = None
+        # Connectors may fall back to full keys when the receiver cannot expand them
+        self._compact_keys = config.compact_keys
 
     async def __aenter__(self):
         await self.connect()
@@ -84,7 +225,11 @@ class BaseSIEMConnector(ABC):
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(self.config.timeout),
             verify=self._get_ssl_verify(),
+            http2=_HTTP2_AVAILABLE,
+            limits=_POOL_LIMITS,
         )
+        # Rebuilt per connection so config changes apply on reconnect
+        self._headers = self._get_headers()
 
     async def disconnect(self) -> None:
         """Close the HTTP client."""
@@ -97,10 +242,65 @@ class BaseSIEMConnector(ABC):
         """Get SSL verification setting."""
         pass
 
+    def _get_headers(self) -> dict[str, str]:
+        """Get request headers."""
+        return {}
+
+    def _health_url(self) -> str | None:
+        """Read-only health endpoint used to warm the connection pool, if the SIEM has one."""
+        return None
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection ahead of the first flush (best effort).
+
+        Only connectors with a known health endpoint warm up; arbitrary receivers
+        (webhooks) are never contacted outside of event delivery.
+        """
+        url = self._health_url()
+        if not url:
+            return
+        if not self._client:
+            await self.connect()
+        try:
+            # Same credentials as event delivery, so secured receivers accept it
+            await self._client.get(url, headers=self._request_headers(), auth=self._auth)
+        except httpx.HTTPError as e:
+            logger.info("siem_warm_up_failed", error=str(e), url=url)
+
+    def _request_headers(self) -> dict[str, str]:
+        """Headers shared by every request, built once instead of per send."""
+        if self._headers is None:
+            self._headers = self._get_headers()
+        return self._headers
+
+    def _event_dict(self, event: SIEMEvent) -> dict[str, Any]:
+        """Event fields as sent, with short key aliases when compact_keys is set."""
+        data = event.to_dict()
+        if not self._compact_keys:
+            return data
+        compact = {}
+        for key, value in data.items():
+            if key in COMPACT_KEYS:
+                key = COMPACT_KEYS[key]
+            elif key in _COMPACT_ALIASES:
+                key = _COMPACT_COLLISION_PREFIX + key
+            compact[key] = value
+        return compact
+
+    def encode_event(self, event: SIEMEvent) -> bytes:
+        """Encode one event into the payload fragment this connector sends."""
+        if not self._compact_keys:
+            return event.to_json()
+        return _dumps(self._event_dict(event))
+
     @abstractmethod
+    async def send_encoded(self, fragments: list[bytes]) -> bool:
+        """Send fragments produced by ``encode_event`` to the SIEM system."""
+        pass
+
     async def send_events(self, events: list[SIEMEvent]) -> bool:
         """Send events to the SIEM system."""
-        pass
+        return await self.send_encoded([self.encode_event(e) for e in events])
 
     async def send_event(self, event: SIEMEvent) -> bool:
         """Send a single event."""
@@ -112,8 +312,13 @@ class BaseSIEMConnector(ABC):
         url: str,
         **kwargs,
     ) -> httpx.Response | None:
-        """Execute request with retry logic."""
+        """Execute request with retry logic.
+
+        Retries back off exponentially with decorrelated jitter, capped at
+        ``retry_max_delay``, so parallel batches do not retry in lockstep.
+        """
         last_error = None
+        delay = self.config.retry_delay
 
         for attempt in range(self.config.retry_count + 1):
             try:
@@ -132,6 +337,17 @@ class BaseSIEMConnector(ABC):
                     url=url,
                 )
 
+                if (
+                    response.status_code < 500
+                    and response.status_code not in _RETRIABLE_CLIENT_ERRORS
+                ):
+                    logger.error(
+                        "siem_request_rejected",
+                        status_code=response.status_code,
+                        url=url,
+                    )
+                    return None
+
             except Exception as e:
                 last_error = e
                 logger.warning(
@@ -142,7 +358,11 @@ class BaseSIEMConnector(ABC):
                 )
 
             if attempt < self.config.retry_count:
-                await asyncio.sleep(self.config.retry_delay * (attempt + 1))
+                delay = min(
+                    self.config.retry_max_delay,
+                    random.uniform(self.config.retry_delay, delay * 3),
+                )
+                await asyncio.sleep(delay)
 
         logger.error(
             "siem_request_exhausted",
@@ -167,9 +387,35 @@ class SplunkConnector(BaseSIEMConnector):
         SIEM_SPLUNK_SOURCETYPE: Source type
     """
 
+    def __init__(self, config: SIEMConfig):
+        super().__init__(config)
+        self._url = self._build_url()
+        self._format_event = self._build_formatter()
+
+    async def connect(self) -> None:
+        await super().connect()
+        self._url = self._build_url()
+        self._format_event = self._build_formatter()
+
+    def _build_url(self) -> str | None:
+        """HEC event endpoint, resolved once rather than per batch."""
+        if not self.config.splunk_url:
+            return None
+        # Ensure URL ends with correct path
+        url = self.config.splunk_url.rstrip("/")
+        if not url.endswith("/services/collector/event"):
+            url = f"{url}/services/collector/event"
+        return url
+
     def _get_ssl_verify(self) -> bool:
         return self.config.splunk_verify_ssl
 
+    def _health_url(self) -> str | None:
+        if not self._url:
+            return None
+        # HEC health check, a sibling of the event endpoint
+        return self._url.removesuffix("/event") + "/health"
+
     def _get_headers(self) -> dict[str, str]:
         """Get request headers for Splunk HEC."""
         token = self.config.splunk_token.get_secret_value() if self.config.splunk_token else ""
@@ -178,45 +424,55 @@ class SplunkConnector(BaseSIEMConnector):
             "Content-Type": "application/json",
         }
 
-    def _format_event(self, event: SIEMEvent) -> dict[str, Any]:
-        """Format event for Splunk HEC."""
-        return {
-            "time": datetime.fromisoformat(event.timestamp.replace("Z", "+00:00")).timestamp(),
-            "host": "egress-guard",
-            "source": self.config.splunk_source,
-            "sourcetype": self.config.splunk_sourcetype,
-            "index": self.config.splunk_index,
-            "event": event.to_dict(),
-        }
-
-    async def send_events(self, events: list[SIEMEvent]) -> bool:
+    def _build_formatter(self) -> Callable[[SIEMEvent], dict[str, Any]]:
+        """Build the HEC event formatter with this config's envelope values bound in.
+
+        Rebuilt on connect(), so per-event formatting does no config lookups.
+        """
+        source = self.config.splunk_source
+        sourcetype = self.config.splunk_sourcetype
+        index = self.config.splunk_index
+        event_dict = self._event_dict if self._compact_keys else SIEMEvent.to_dict
+
+        def format_event(event: SIEMEvent) -> dict[str, Any]:
+            """Format event for Splunk HEC."""
+            return {
+                "time": event.epoch,
+                "host": "egress-guard",
+                "source": source,
+                "sourcetype": sourcetype,
+                "index": index,
+                "event": event_dict(event),
+            }
+
+        return format_event
+
+    def encode_event(self, event: SIEMEvent) -> bytes:
+        return _dumps(self._format_event(event))
+
+    async def send_encoded(self, fragments: list[bytes]) -> bool:
         """Send events to Splunk HEC."""
-        if not events:
+        if not fragments:
             return True
 
-        if not self.config.splunk_url:
+        if not self._url:
             logger.error("siem_splunk_no_url")
             return False
 
         # Format events for HEC (newline-delimited JSON)
-        payload = "\n".join(json.dumps(self._format_event(e)) for e in events)
-
-        # Ensure URL ends with correct path
-        url = self.config.splunk_url.rstrip("/")
-        if not url.endswith("/services/collector/event"):
-            url = f"{url}/services/collector/event"
+        payload = _FragmentStream(fragments, separator=b"\n")
 
         response = await self._retry_request(
             "POST",
-            url,
+            self._url,
             content=payload,
-            headers=self._get_headers(),
+            headers=payload.headers(self._request_headers()),
         )
 
         if response and response.status_code == 200:
             logger.info(
                 "siem_splunk_sent",
-                event_count=len(events),
+                event_count=len(fragments),
             )
             return True
 
@@ -236,9 +492,76 @@ class ElasticsearchConnector(BaseSIEMConnector):
         SIEM_ELASTIC_USERNAME/PASSWORD: Basic auth (alternative)
     """
 
+    def __init__(self, config: SIEMConfig):
+        super().__init__(config)
+        self._auth = self._get_auth()
+        self._bulk_url = self._build_bulk_url()
+        # (index name, bulk action line) for the most recent daily index, reused
+        # across events; one tuple so concurrent encoders never see a mixed pair
+        self._action: tuple[str, bytes] | None = None
+
+    async def connect(self) -> None:
+        await super().connect()
+        self._auth = self._get_auth()
+        self._compact_keys = self.config.compact_keys
+        if self._compact_keys and not await self._install_expand_pipeline():
+            # Bulk requests naming a missing pipeline are rejected outright, so
+            # send full keys to the plain endpoint rather than drop every event
+            self._compact_keys = False
+        self._bulk_url = self._build_bulk_url()
+
+    def _build_bulk_url(self) -> str | None:
+        """Bulk API endpoint, resolved once rather than per batch."""
+        if not self.config.elastic_url:
+            return None
+        url = f"{self.config.elastic_url.rstrip('/')}/_bulk"
+        if self._compact_keys:
+            url = f"{url}?pipeline={self._expand_pipeline}"
+        return url
+
+    @property
+    def _expand_pipeline(self) -> str:
+        return f"{self.config.elastic_index}-expand-keys"
+
+    async def _install_expand_pipeline(self) -> bool:
+        """Register the ingest pipeline renaming compact keys back to full names.
+
+        Returns True when the pipeline is in place.
+        """
+        if not self.config.elastic_url:
+            return False
+        body = {
+            "description": "Expand egress-guard compact SIEM keys",
+            "processors": [
+                {"rename": {"field": short, "target_field": full, "ignore_missing": True}}
+                for full, short in COMPACT_KEYS.items()
+            ],
+        }
+        url = f"{self.config.elastic_url.rstrip('/')}/_ingest/pipeline/{self._expand_pipeline}"
+        response = await self._retry_request(
+            "PUT",
+            url,
+            content=_dumps(body),
+            headers={**self._request_headers(), "Content-Type": "application/json"},
+            auth=self._auth,
+        )
+        if response is None:
+            logger.warning(
+                "siem_elastic_pipeline_failed",
+                pipeline=self._expand_pipeline,
+                fallback="full_keys",
+            )
+            return False
+        return True
+
     def _get_ssl_verify(self) -> bool:
         return self.config.elastic_verify_ssl
 
+    def _health_url(self) -> str | None:
+        if not self.config.elastic_url:
+            return None
+        return f"{self.config.elastic_url.rstrip('/')}/_cluster/health"
+
     def _get_headers(self) -> dict[str, str]:
         """Get request headers for Elasticsearch."""
         headers = {"Content-Type": "application/x-ndjson"}
@@ -257,47 +580,58 @@ class ElasticsearchConnector(BaseSIEMConnector):
             )
         return None
 
-    def _format_bulk_payload(self, events: list[SIEMEvent]) -> str:
+    def encode_event(self, event: SIEMEvent) -> bytes:
+        """Encode the bulk action and document lines for one event."""
+        # Daily index taken from the event's own (UTC, ISO 8601) timestamp
+        index_name = f"{self.config.elastic_index}-{event.timestamp[:10].replace('-', '.')}"
+        action = self._action
+        if action is None or action[0] != index_name:
+            action = (index_name, _dumps_line({"index": {"_index": index_name}}))
+            self._action = action
+        # Copy: the non-compact dict is the event's shared cached dict
+        doc = dict(self._event_dict(event))
+        doc["@timestamp"] = doc.pop("timestamp")
+        return action[1] + _dumps_line(doc)
+
+    def _format_bulk_payload(self, events: list[SIEMEvent]) -> bytes:
         """Format events for Elasticsearch Bulk API."""
-        lines = []
-        index_name = f"{self.config.elastic_index}-{datetime.utcnow().strftime('%Y.%m.%d')}"
-
-        for event in events:
-            # Index action
-            lines.append(json.dumps({"index": {"_index": index_name}}))
-            # Document
-            doc = event.to_dict()
-            doc["@timestamp"] = doc.pop("timestamp")
-            lines.append(json.dumps(doc))
+        return b"".join([self.encode_event(e) for e in events])
 
-        return "\n".join(lines) + "\n"
-
-    async def send_events(self, events: list[SIEMEvent]) -> bool:
+    async def send_encoded(self, fragments: list[bytes]) -> bool:
         """Send events to Elasticsearch."""
-        if not events:
+        if not fragments:
             return True
 
-        if not self.config.elastic_url:
+        if not self._bulk_url:
             logger.error("siem_elastic_no_url")
             return False
 
-        url = f"{self.config.elastic_url.rstrip('/')}/_bulk"
-        payload = self._format_bulk_payload(events)
+        # Each fragment already ends with a newline, as the Bulk API requires
+        payload = _FragmentStream(fragments)
 
         response = await self._retry_request(
             "POST",
-            url,
+            self._bulk_url,
             content=payload,
-            headers=self._get_headers(),
-            auth=self._get_auth(),
+            headers=payload.headers(self._request_headers()),
+            auth=self._auth,
         )
 
         if response and response.status_code in (200, 201):
-            result = response.json()
+            body = response.content
+            # Bulk responses lead with `"errors":false` on success; only parse the
+            # (potentially huge) per-item body when that is not the case
+            if _BULK_NO_ERRORS in body[:128]:
+                logger.info(
+                    "siem_elastic_sent",
+                    event_count=len(fragments),
+                )
+                return True
+            result = orjson.loads(body)
             if not result.get("errors"):
                 logger.info(
                     "siem_elastic_sent",
-                    event_count=len(events),
+                    event_count=len(fragments),
                 )
                 return True
             else:
@@ -322,20 +656,33 @@ class WebhookConnector(BaseSIEMConnector):
         SIEM_WEBHOOK_AUTH_HEADER: Authorization header value
     """
 
+    def __init__(self, config: SIEMConfig):
+        super().__init__(config)
+        # Parsed once per connector; reconnects rebuild headers from this dict
+        self._custom_headers = self._parse_custom_headers()
+
     def _get_ssl_verify(self) -> bool:
         return True  # Always verify for webhooks
 
+    def _parse_custom_headers(self) -> dict[str, str]:
+        """Decode SIEM_WEBHOOK_HEADERS, logging (once) when it is not a JSON object."""
+        if not self.config.webhook_headers:
+            return {}
+        try:
+            custom_headers = orjson.loads(self.config.webhook_headers)
+        except orjson.JSONDecodeError:
+            custom_headers = None
+        if not isinstance(custom_headers, dict):
+            logger.warning("siem_webhook_invalid_headers")
+            return {}
+        return {str(key): str(value) for key, value in custom_headers.items()}
+
     def _get_headers(self) -> dict[str, str]:
         """Get request headers for webhook."""
         headers = {"Content-Type": "application/json"}
 
         # Add custom headers
-        if self.config.webhook_headers:
-            try:
-                custom_headers = json.loads(self.config.webhook_headers)
-                headers.update(custom_headers)
-            except json.JSONDecodeError:
-                logger.warning("siem_webhook_invalid_headers")
+        headers.update(self._custom_headers)
 
         # Add auth header
         if self.config.webhook_auth_header:
@@ -343,33 +690,34 @@ class WebhookConnector(BaseSIEMConnector):
 
         return headers
 
-    async def send_events(self, events: list[SIEMEvent]) -> bool:
+    async def send_encoded(self, fragments: list[bytes]) -> bool:
         """Send events to webhook."""
-        if not events:
+        if not fragments:
             return True
 
         if not self.config.webhook_url:
             logger.error("siem_webhook_no_url")
             return False
 
-        # Send as array of events
-        payload = {
-            "source": "egress-guard",
-            "event_count": len(events),
-            "events": [e.to_dict() for e in events],
-        }
+        # Send as array of events; fragments are spliced in without re-encoding
+        payload = _FragmentStream(
+            fragments,
+            separator=b",",
+            prefix=b'{"source":"egress-guard","event_count":%d,"events":[' % len(fragments),
+            suffix=b"]}",
+        )
 
         response = await self._retry_request(
             self.config.webhook_method,
             self.config.webhook_url,
-            json=payload,
-            headers=self._get_headers(),
+            content=payload,
+            headers=payload.headers(self._request_headers()),
         )
 
         if response and response.status_code < 400:
             logger.info(
                 "siem_webhook_sent",
-                event_count=len(events),
+                event_count=len(fragments),
                 status_code=response.status_code,
             )
             return True
@@ -29,10 +29,22 @@ logger = structlog.get_logger(__name__)
 class SIEMMetrics:
     """Metrics for SIEM operations."""
 
+    __slots__ = (
+        "events_queued",
+        "events_sent",
+        "events_failed",
+        "events_rejected",
+        "batches_sent",
+        "batches_failed",
+        "last_send_time",
+        "last_error",
+    )
+
     def __init__(self):
         self.events_queued = 0
         self.events_sent = 0
         self.events_failed = 0
+        self.events_rejected = 0
         self.batches_sent = 0
         self.batches_failed = 0
         self.last_send_time: datetime | None = None
@@ -43,6 +55,7 @@ class SIEMMetrics:
             "events_queued": self.events_queued,
             "events_sent": self.events_sent,
             "events_failed": self.events_failed,
+            "events_rejected": self.events_rejected,
             "batches_sent": self.batches_sent,
             "batches_failed": self.batches_failed,
             "last_send_time": self.last_send_time.isoformat() if self.last_send_time else None,
@@ -74,12 +87,24 @@ class SIEMManager:
     """
 
     MAX_QUEUE_SIZE = 10000
+    # Batches allowed in flight at once; the next batch is drained while earlier
+    # ones are still waiting on their HTTP round-trip
+    MAX_CONCURRENT_SENDS = 4
 
     def __init__(self, config: SIEMConfig | None = None):
         self.config = config or SIEMConfig()
-        self._queue: deque[SIEMEvent] = deque(maxlen=self.MAX_QUEUE_SIZE)
+        # Events are encoded for the connector when queued; SIEMEvent objects only
+        # remain for events queued before a connector exists. No maxlen: a bounded
+        # deque would silently evict the oldest event, so producers check
+        # MAX_QUEUE_SIZE themselves and reject instead. A deque (not asyncio.Queue)
+        # because queue_finding may be called from worker threads.
+        self._queue: deque[bytes | SIEMEvent] = deque()
         self._connector: BaseSIEMConnector | None = None
         self._flush_task: asyncio.Task | None = None
+        # Set when a full batch is waiting; the consumer otherwise wakes on flush_interval
+        self._flush_event = asyncio.Event()
+        self._send_slots = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        self._inflight: set[asyncio.Task] = set()
         self._running = False
         self.metrics = SIEMMetrics()
 
@@ -116,6 +141,7 @@ class SIEMManager:
         self._connector = self._create_connector()
         if self._connector:
             await self._connector.connect()
+            await self._connector.warm_up()
 
         # Start background flush task
         self._running = True
@@ -140,8 +166,11 @@ class SIEMManager:
             except asyncio.CancelledError:
                 pass
 
-        # Flush remaining events
-        await self._flush()
+        # Let in-flight batches finish, then flush remaining events
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while self._connector and self._queue:
+            await self._flush()
 
         # Disconnect connector
         if self._connector:
@@ -159,15 +188,16 @@ class SIEMManager:
             return True  # Silently accept when disabled
 
         if len(self._queue) >= self.MAX_QUEUE_SIZE:
+            self.metrics.events_rejected += 1
             logger.warning("siem_queue_full", queue_size=len(self._queue))
             return False
 
-        self._queue.append(event)
+        self._queue.append(self._encode(event))
         self.metrics.events_queued += 1
 
-        # Flush if batch is full
+        # Wake the consumer if batch is full
         if len(self._queue) >= self.config.batch_size:
-            asyncio.create_task(self._flush())
+            self._flush_event.set()
 
         return True
 
@@ -188,6 +218,15 @@ class SIEMManager:
 
         This is a sync wrapper that schedules the async queue_event.
         """
+        # Decide before building anything: this runs on the guard request path
+        if not self.config.enabled:
+            return True  # Silently accept when disabled, as queue_event does
+
+        # Use sync queue for now (called from sync context)
+        if len(self._queue) >= self.MAX_QUEUE_SIZE:
+            self.metrics.events_rejected += 1
+            return False
+
         event = SIEMEvent(
             event_type="finding",
             rule_id=rule_id,
@@ -200,30 +239,44 @@ class SIEMManager:
             metadata={"blocked": blocked, **metadata},
         )
 
-        # Use sync queue for now (called from sync context)
-        if len(self._queue) >= self.MAX_QUEUE_SIZE:
-            return False
-
-        self._queue.append(event)
+        self._queue.append(self._encode(event))
         self.metrics.events_queued += 1
         return True
 
+    def _encode(self, event: SIEMEvent) -> bytes | SIEMEvent:
+        """Pre-encode ``event`` for the connector, keeping the object as a fallback."""
+        if not self._connector:
+            return event
+        try:
+            return self._connector.encode_event(event)
+        except TypeError:
+            # Unserializable metadata: leave it to _flush, which counts the failure
+            return event
+
+    def _take_batch(self) -> list[bytes | SIEMEvent]:
+        """Pop up to ``batch_size`` queued events."""
+        # Size is fixed up front so the drain needs no per-item checks
+        popleft = self._queue.popleft
+        return [popleft() for _ in range(min(len(self._queue), self.config.batch_size))]
+
     async def _flush(self) -> None:
-        """Flush queued events to SIEM."""
+        """Flush one batch of queued events to SIEM."""
         if not self._connector or not self._queue:
             return
 
-        # Get batch of events
-        batch: list[SIEMEvent] = []
-        while self._queue and len(batch) < self.config.batch_size:
-            batch.append(self._queue.popleft())
+        batch = self._take_batch()
+        if batch:
+            await self._send_batch(batch)
 
-        if not batch:
+    async def _send_batch(self, batch: list[bytes | SIEMEvent]) -> None:
+        """Send a batch and record the outcome in metrics."""
+        if not self._connector:
             return
 
-        # Send batch
         try:
-            success = await self._connector.send_events(batch)
+            encode = self._connector.encode_event
+            fragments = [item if type(item) is bytes else encode(item) for item in batch]
+            success = await self._connector.send_encoded(fragments)
 
             if success:
                 self.metrics.events_sent += len(batch)
@@ -240,12 +293,32 @@ class SIEMManager:
             self.metrics.last_error = str(e)
             logger.error("siem_flush_error", error=str(e))
 
+    def _send_done(self, task: asyncio.Task) -> None:
+        self._inflight.discard(task)
+        self._send_slots.release()
+
     async def _flush_loop(self) -> None:
-        """Background task that periodically flushes events."""
+        """Background consumer sending batches when one fills up or flush_interval elapses."""
         while self._running:
             try:
-                await asyncio.sleep(self.config.flush_interval)
-                await self._flush()
+                try:
+                    await asyncio.wait_for(
+                        self._flush_event.wait(), timeout=self.config.flush_interval
+                    )
+                except TimeoutError:
+                    pass
+                self._flush_event.clear()
+
+                while self._connector and self._queue:
+                    # Take the slot before the batch so a cancelled wait loses no events
+                    await self._send_slots.acquire()
+                    batch = self._take_batch()
+                    if not batch:
+                        self._send_slots.release()
+                        break
+                    task = asyncio.create_task(self._send_batch(batch))
+                    self._inflight.add(task)
+                    task.add_done_callback(self._send_done)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -13,16 +13,75 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
+    # file_digest feeds large buffers to OpenSSL with the GIL released
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+CHUNK_KEYS = {"offset": int, "size": int, "sha256": str}
+
+
+def verify_chunks(path: Path, chunks: list[dict[str, Any]], size: int) -> list[str]:
+    """Check per-chunk hashes from the manifest, hashing chunks in parallel.
+
+    hashlib releases the GIL on large buffers, so threads scale across cores.
+    The chunks must tile the whole file, so they replace the whole-file hash;
+    a mismatch pinpoints the corrupt range.
+    """
+    errors = []
+    for index, chunk in enumerate(chunks):
+        if not isinstance(chunk, dict):
+            errors.append(f"Chunk {index} is not an object")
+            continue
+        for key, expected_type in CHUNK_KEYS.items():
+            value = chunk.get(key)
+            # bool is an int subclass but never a valid offset or size
+            if not isinstance(value, expected_type) or isinstance(value, bool):
+                errors.append(f"Chunk {index} has invalid {key!r}: {value!r}")
+            elif expected_type is int and value < 0:
+                errors.append(f"Chunk {index} has negative {key!r}: {value}")
+    if errors:
+        return errors
+
+    expected_offset = 0
+    for chunk in sorted(chunks, key=lambda c: c["offset"]):
+        if chunk["offset"] != expected_offset:
+            errors.append(f"Chunk coverage gap at offset {expected_offset}")
+        expected_offset = chunk["offset"] + chunk["size"]
+    if expected_offset != size:
+        errors.append(f"Chunks cover {expected_offset} bytes, file has {size}")
+    if errors or size == 0:
+        return errors
+
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as view,
+    ):
+
+        def digest(chunk: dict[str, Any]) -> str:
+            start = chunk["offset"]
+            return hashlib.sha256(view[start : start + chunk["size"]]).hexdigest()
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            actual = list(pool.map(digest, chunks))
+
+    for chunk, actual_sha in zip(chunks, actual, strict=True):
+        if chunk["sha256"] != actual_sha:
+            errors.append(
+                f"Chunk SHA mismatch at offset {chunk['offset']}: "
+                f"expected {chunk['sha256']}, got {actual_sha}"
+            )
+    return errors
 
 
 def main() -> None:
@@ -39,13 +98,19 @@ def main() -> None:
     manifest = json.loads(args.manifest.read_text(encoding="utf-8"))
     expected_sha = manifest.get("sha256")
     expected_size = manifest.get("size_bytes")
+    chunks = manifest.get("chunks")
 
-    actual_sha = sha256_file(args.model)
     actual_size = args.model.stat().st_size
 
     errors = []
-    if expected_sha and expected_sha != actual_sha:
-        errors.append(f"SHA mismatch: expected {expected_sha}, got {actual_sha}")
+    if chunks:
+        # Chunks tiling the file cover every byte, so the serial pass is skipped
+        errors.extend(verify_chunks(args.model, chunks, actual_size))
+        actual_sha = f"verified in {len(chunks)} chunks"
+    else:
+        actual_sha = sha256_file(args.model)
+        if expected_sha and expected_sha != actual_sha:
+            errors.append(f"SHA mismatch: expected {expected_sha}, got {actual_sha}")
     if expected_size and expected_size != actual_size:
         errors.append(f"Size mismatch: expected {expected_size}, got {actual_size}")
 
@@ -63,8 +128,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
-
-
-
-
@@ -21,43 +21,90 @@ Usage:
 
     # Specify time range (default: last 7 days):
     python scripts/export_weekly_report.py --days 14
+
+    # Bypass the hourly cache of Prometheus results (~/.cache/egress-guard-reports):
+    python scripts/export_weekly_report.py --no-cache
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import atexit
+import functools
+import io
+import sys
+import time
 from datetime import datetime, timedelta
+from hashlib import blake2b
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+import httpx
+import orjson
 
-import requests
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
 
 DEFAULT_PROMETHEUS_URL = "http://localhost:9090"
 
+# Shared by the sync and async clients; with HTTP/2 every query rides one connection
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=4)
+_client: httpx.Client | None = None
+
+# Prefetched query results are reused by runs within the same hour (e.g. cron retries)
+_CACHE_DIR = Path("~/.cache/egress-guard-reports").expanduser()
+_CACHE_TTL_SECONDS = 3600
+
+
+def _get_client() -> httpx.Client:
+    """Return the process-wide keep-alive client used by the sync helpers."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=10, http2=_HTTP2_AVAILABLE, limits=_CLIENT_LIMITS)
+        atexit.register(_client.close)
+    return _client
+
+
+@functools.lru_cache(maxsize=64)
+def _query_prometheus_cached(
+    query: str,
+    prometheus_url: str,
+    time: int | None,
+) -> list[dict[str, Any]]:
+    params = {"query": query}
+    if time is not None:
+        params["time"] = time
+
+    response = _get_client().get(
+        f"{prometheus_url}/api/v1/query",
+        params=params,
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if data.get("status") == "success":
+        return data.get("data", {}).get("result", [])
+    return []
+
 
 def query_prometheus(
     query: str,
     prometheus_url: str = DEFAULT_PROMETHEUS_URL,
     time: datetime | None = None,
 ) -> list[dict[str, Any]]:
-    """Execute a PromQL instant query."""
-    params = {"query": query}
-    if time:
-        params["time"] = time.timestamp()
+    """Execute a PromQL instant query.
 
+    ``time`` is truncated to whole seconds so repeated queries within a run are
+    served from memory. Failures are not cached.
+    """
+    epoch = int(time.timestamp()) if time else None
     try:
-        response = requests.get(
-            f"{prometheus_url}/api/v1/query",
-            params=params,
-            timeout=10,
-        )
-        response.raise_for_status()
-        data = response.json()
-        if data.get("status") == "success":
-            return data.get("data", {}).get("result", [])
-        return []
-    except requests.exceptions.RequestException:
+        return _query_prometheus_cached(query, prometheus_url, epoch)
+    except (httpx.HTTPError, orjson.JSONDecodeError):
         return []
 
 
@@ -80,26 +127,169 @@ def query_prometheus_range(
     }
 
     try:
-        response = requests.get(
+        response = _get_client().get(
             f"{prometheus_url}/api/v1/query_range",
             params=params,
             timeout=30,
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         if data.get("status") == "success":
             return data.get("data", {}).get("result", [])
         return []
-    except requests.exceptions.RequestException:
+    except (httpx.HTTPError, orjson.JSONDecodeError):
         return []
 
 
-def get_top_rules(prometheus_url: str, limit: int = 10) -> list[tuple[str, float]]:
-    """Get top triggered rules by count."""
-    results = query_prometheus(
-        "topk(10, sum by (rule_id) (egress_guard_rule_hits_total))",
-        prometheus_url,
+def _latency_quantiles_query(rate_by_le: str) -> str:
+    """p50/p95/p99 in one query, each series tagged with a "quantile" label."""
+    return " or ".join(
+        f'label_replace(histogram_quantile({q}, {rate_by_le}) * 1000, "quantile", "{key}", "", "")'
+        for key, q in (("p50", "0.50"), ("p95", "0.95"), ("p99", "0.99"))
+    )
+
+
+# Reads the per-bucket rate precomputed by prometheus/rules/recording.yml
+_LATENCY_QUANTILES_QUERY = _latency_quantiles_query(
+    "le:egress_guard_latency_seconds_bucket:rate24h"
+)
+# Same quantiles from raw buckets, for Prometheus servers without the recording rule
+_LATENCY_QUANTILES_RAW_QUERY = _latency_quantiles_query(
+    "sum(rate(egress_guard_latency_seconds_bucket[24h])) by (le)"
+)
+
+# Instant queries behind the report, prefetched concurrently by _collect_all
+REPORT_QUERIES = {
+    "top_rules": "topk(10, sum by (rule_id) (egress_guard_rule_hits_total))",
+    "latency_avg": "(egress_guard_latency_seconds_sum / egress_guard_latency_seconds_count) * 1000",
+    "latency_quantiles": _LATENCY_QUANTILES_QUERY,
+    "block_rate": "sum(egress_guard_blocked_total) / sum(egress_guard_latency_seconds_count) * 100",
+    "total_requests": "sum(egress_guard_latency_seconds_count)",
+    "total_blocked": "sum(egress_guard_blocked_total)",
+    "context_distribution": "sum by (type) (egress_guard_context_type_total)",
+    "explain_only": "sum(egress_guard_explain_only_total)",
+    "ml_load": "sum by (status) (egress_guard_ml_preclf_load_total)",
+    "ml_shadow": "sum(egress_guard_ml_preclf_shadow_total)",
+}
+
+
+async def _query(client: httpx.AsyncClient, query: str) -> list[dict[str, Any]] | None:
+    """Execute a PromQL instant query on a shared async client; None if it failed."""
+    try:
+        response = await client.get("/api/v1/query", params={"query": query})
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        if data.get("status") == "success":
+            return data.get("data", {}).get("result", [])
+        return None
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+def _async_client(prometheus_url: str) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=prometheus_url,
+        timeout=10,
+        http2=_HTTP2_AVAILABLE,  # Multiplexes all queries over one connection
+        limits=_CLIENT_LIMITS,
     )
+
+
+async def _collect_all(
+    client: httpx.AsyncClient,
+) -> tuple[dict[str, list[dict[str, Any]]], bool]:
+    """Run every report query concurrently instead of one round-trip at a time.
+
+    Failed queries yield empty results; the flag says whether all of them succeeded.
+    """
+    results = await asyncio.gather(*[_query(client, q) for q in REPORT_QUERIES.values()])
+    complete = all(result is not None for result in results)
+    pairs = zip(REPORT_QUERIES, results, strict=True)
+    return {name: result or [] for name, result in pairs}, complete
+
+
+def _cache_path(prometheus_url: str) -> Path:
+    """Cache file for this URL, query set and current hour bucket."""
+    bucket = int(time.time() // _CACHE_TTL_SECONDS)
+    key = orjson.dumps([prometheus_url, bucket, REPORT_QUERIES])
+    return _CACHE_DIR / f"{blake2b(key, digest_size=16).hexdigest()}.json"
+
+
+def _read_cache(path: Path) -> dict[str, list[dict[str, Any]]] | None:
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cache(path: Path, results: dict[str, list[dict[str, Any]]]) -> None:
+    """Store ``results`` and drop entries from earlier buckets; failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(results))
+        tmp.replace(path)
+        cutoff = time.time() - _CACHE_TTL_SECONDS
+        for stale in path.parent.glob("*.json"):
+            if stale != path and stale.stat().st_mtime < cutoff:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+async def _prefetch(prometheus_url: str) -> tuple[dict[str, list[dict[str, Any]]], bool]:
+    """Check Prometheus is reachable, then prefetch all report queries on one client.
+
+    Returns the results and whether Prometheus was reachable and every query succeeded.
+    """
+    async with _async_client(prometheus_url) as client:
+        reachable = True
+        try:
+            response = await client.get("/api/v1/status/config", timeout=5)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            reachable = False
+            print(f"Warning: Cannot connect to Prometheus at {prometheus_url}")
+            print("Report will contain default/zero values.")
+        results, complete = await _collect_all(client)
+        return results, reachable and complete
+
+
+def fetch_report_data(
+    prometheus_url: str, use_cache: bool = True
+) -> dict[str, list[dict[str, Any]]]:
+    """Prefetch all report queries, reusing results cached within the current hour."""
+    path = _cache_path(prometheus_url)
+    if use_cache:
+        cached = _read_cache(path)
+        if cached is not None:
+            return cached
+
+    results, complete = asyncio.run(_prefetch(prometheus_url))
+    if use_cache and complete:
+        # Empty results standing in for failed queries must not be pinned for the hour
+        _write_cache(path, results)
+    return results
+
+
+def _results(
+    name: str,
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None,
+) -> list[dict[str, Any]]:
+    """Return the prefetched result for ``name``, querying Prometheus if there is none."""
+    if prefetched is not None and name in prefetched:
+        return prefetched[name]
+    return query_prometheus(REPORT_QUERIES[name], prometheus_url)
+
+
+def get_top_rules(
+    prometheus_url: str,
+    limit: int = 10,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> list[tuple[str, float]]:
+    """Get top triggered rules by count."""
+    results = _results("top_rules", prometheus_url, prefetched)
     rules = []
     for r in results:
         rule_id = r.get("metric", {}).get("rule_id", "unknown")
@@ -108,57 +298,37 @@ def get_top_rules(prometheus_url: str, limit: int = 10) -> list[tuple[str, float
     return sorted(rules, key=lambda x: x[1], reverse=True)[:limit]
 
 
-def get_latency_stats(prometheus_url: str) -> dict[str, float]:
+def get_latency_stats(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> dict[str, float]:
     """Get latency percentiles."""
     stats = {}
 
     # Average
-    results = query_prometheus(
-        "(egress_guard_latency_seconds_sum / egress_guard_latency_seconds_count) * 1000",
-        prometheus_url,
-    )
+    results = _results("latency_avg", prometheus_url, prefetched)
     if results:
         stats["avg"] = float(results[0].get("value", [0, 0])[1])
 
-    # P50
-    results = query_prometheus(
-        "histogram_quantile(0.50, sum(rate(egress_guard_latency_seconds_bucket[24h])) by (le)) * 1000",
-        prometheus_url,
-    )
-    if results:
-        val = results[0].get("value", [0, 0])[1]
-        if val != "NaN":
-            stats["p50"] = float(val)
-
-    # P95
-    results = query_prometheus(
-        "histogram_quantile(0.95, sum(rate(egress_guard_latency_seconds_bucket[24h])) by (le)) * 1000",
-        prometheus_url,
-    )
-    if results:
-        val = results[0].get("value", [0, 0])[1]
-        if val != "NaN":
-            stats["p95"] = float(val)
-
-    # P99
-    results = query_prometheus(
-        "histogram_quantile(0.99, sum(rate(egress_guard_latency_seconds_bucket[24h])) by (le)) * 1000",
-        prometheus_url,
-    )
-    if results:
-        val = results[0].get("value", [0, 0])[1]
-        if val != "NaN":
-            stats["p99"] = float(val)
+    # P50 / P95 / P99
+    results = _results("latency_quantiles", prometheus_url, prefetched)
+    if not results:
+        results = query_prometheus(_LATENCY_QUANTILES_RAW_QUERY, prometheus_url)
+    for r in results:
+        key = r.get("metric", {}).get("quantile")
+        val = r.get("value", [0, 0])[1]
+        if key and val != "NaN":
+            stats[key] = float(val)
 
     return stats
 
 
-def get_block_rate(prometheus_url: str) -> float:
+def get_block_rate(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> float:
     """Get current block rate percentage."""
-    results = query_prometheus(
-        "sum(egress_guard_blocked_total) / sum(egress_guard_latency_seconds_count) * 100",
-        prometheus_url,
-    )
+    results = _results("block_rate", prometheus_url, prefetched)
     if results:
         val = results[0].get("value", [0, 0])[1]
         if val != "NaN":
@@ -166,34 +336,34 @@ def get_block_rate(prometheus_url: str) -> float:
     return 0.0
 
 
-def get_total_requests(prometheus_url: str) -> int:
+def get_total_requests(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> int:
     """Get total request count."""
-    results = query_prometheus(
-        "sum(egress_guard_latency_seconds_count)",
-        prometheus_url,
-    )
+    results = _results("total_requests", prometheus_url, prefetched)
     if results:
         return int(float(results[0].get("value", [0, 0])[1]))
     return 0
 
 
-def get_total_blocked(prometheus_url: str) -> int:
+def get_total_blocked(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> int:
     """Get total blocked count."""
-    results = query_prometheus(
-        "sum(egress_guard_blocked_total)",
-        prometheus_url,
-    )
+    results = _results("total_blocked", prometheus_url, prefetched)
     if results:
         return int(float(results[0].get("value", [0, 0])[1]))
     return 0
 
 
-def get_context_distribution(prometheus_url: str) -> dict[str, int]:
+def get_context_distribution(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> dict[str, int]:
     """Get context type distribution."""
-    results = query_prometheus(
-        "sum by (type) (egress_guard_context_type_total)",
-        prometheus_url,
-    )
+    results = _results("context_distribution", prometheus_url, prefetched)
     dist = {}
     for r in results:
         ctx_type = r.get("metric", {}).get("type", "unknown")
@@ -202,26 +372,26 @@ def get_context_distribution(prometheus_url: str) -> dict[str, int]:
     return dist
 
 
-def get_explain_only_count(prometheus_url: str) -> int:
+def get_explain_only_count(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> int:
     """Get explain-only detection count."""
-    results = query_prometheus(
-        "sum(egress_guard_explain_only_total)",
-        prometheus_url,
-    )
+    results = _results("explain_only", prometheus_url, prefetched)
     if results:
         return int(float(results[0].get("value", [0, 0])[1]))
     return 0
 
 
-def get_ml_stats(prometheus_url: str) -> dict[str, Any]:
+def get_ml_stats(
+    prometheus_url: str,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
     """Get ML pre-classifier statistics."""
     stats = {}
 
     # Load status
-    results = query_prometheus(
-        'sum by (status) (egress_guard_ml_preclf_load_total)',
-        prometheus_url,
-    )
+    results = _results("ml_load", prometheus_url, prefetched)
     stats["load"] = {}
     for r in results:
         status = r.get("metric", {}).get("status", "unknown")
@@ -229,170 +399,187 @@ def get_ml_stats(prometheus_url: str) -> dict[str, Any]:
         stats["load"][status] = value
 
     # Shadow mode disagreements
-    results = query_prometheus(
-        'sum(egress_guard_ml_preclf_shadow_total)',
-        prometheus_url,
-    )
+    results = _results("ml_shadow", prometheus_url, prefetched)
     if results:
         stats["shadow_total"] = int(float(results[0].get("value", [0, 0])[1]))
 
     return stats
 
 
-def generate_report(
+# Markdown report templates; row formatters are bound once, as they run per table row
+_REPORT_HEADER = """# LLM Egress Guard - Weekly Report
+
+**Report Period:** {start} to {end}
+**Generated:** {generated}
+**Week:** {year}-W{week:02d}
+
+---
+
+## Executive Summary
+
+"""
+_SUMMARY_TABLE = """| Metric | Value |
+|--------|-------|
+| Total Requests | {total_requests:,} |
+| Total Blocked | {total_blocked:,} |
+| Block Rate | {block_rate:.1f}% |
+| Avg Latency | {avg:.2f}ms |
+| P95 Latency | {p95:.2f}ms |
+
+---
+
+## Top Triggered Rules
+
+"""
+_RULE_TABLE_HEADER = "| Rank | Rule ID | Count |\n|------|---------|-------|\n"
+_format_rule_row = "| {} | `{}` | {:,} |\n".format
+_LATENCY_HEADER = """
+---
+
+## Latency Performance
+
+| Percentile | Value |
+|------------|-------|
+"""
+_format_latency_row = "| {} | {:.2f}ms |\n".format
+_CONTEXT_HEADER = "\n---\n\n## Context Distribution\n\n"
+_CTX_TABLE_HEADER = "| Context Type | Count | Percentage |\n|--------------|-------|------------|\n"
+_format_ctx_row = "| {} | {:,} | {:.1f}% |\n".format
+_EXPLAIN_ONLY_SECTION = """
+---
+
+## Explain-Only Detections
+
+**Total Explain-Only:** {:,}
+
+These are findings that were detected but not blocked because they appeared in educational/tutorial context.
+
+---
+
+## ML Pre-Classifier Status
+
+"""
+_RECOMMENDATIONS_HEADER = "\n---\n\n## Recommendations\n\nBased on this week's data:\n\n"
+_REPORT_FOOTER = "\n---\n\n*Report generated by `scripts/export_weekly_report.py`*"
+
+
+def write_report(
     prometheus_url: str,
-    days: int = 7,
-) -> str:
-    """Generate the weekly report in Markdown format."""
+    days: int,
+    out: IO[str],
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> None:
+    """Write the weekly report in Markdown format to ``out`` as it is formatted.
+
+    ``prefetched`` maps REPORT_QUERIES names to results from _collect_all;
+    anything missing is queried serially on the shared sync client.
+    """
+    # Every date in the report derives from one clock read; isoformat yields the
+    # same YYYY-MM-DD / YYYY-MM-DD HH:MM:SS text without going through strftime
     now = datetime.now()
-    week_num = now.isocalendar()[1]
-    year = now.year
-
-    lines = [
-        f"# LLM Egress Guard - Weekly Report",
-        "",
-        f"**Report Period:** {(now - timedelta(days=days)).strftime('%Y-%m-%d')} to {now.strftime('%Y-%m-%d')}",
-        f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S')}",
-        f"**Week:** {year}-W{week_num:02d}",
-        "",
-        "---",
-        "",
-        "## Executive Summary",
-        "",
-    ]
+    iso_week = now.isocalendar()
+    write = out.write
+
+    write(
+        _REPORT_HEADER.format(
+            start=(now - timedelta(days=days)).date().isoformat(),
+            end=now.date().isoformat(),
+            generated=now.isoformat(sep=" ", timespec="seconds"),
+            year=iso_week.year,
+            week=iso_week.week,
+        )
+    )
 
     # Summary stats
-    total_requests = get_total_requests(prometheus_url)
-    total_blocked = get_total_blocked(prometheus_url)
-    block_rate = get_block_rate(prometheus_url)
-    latency = get_latency_stats(prometheus_url)
-
-    lines.extend([
-        "| Metric | Value |",
-        "|--------|-------|",
-        f"| Total Requests | {total_requests:,} |",
-        f"| Total Blocked | {total_blocked:,} |",
-        f"| Block Rate | {block_rate:.1f}% |",
-        f"| Avg Latency | {latency.get('avg', 0):.2f}ms |",
-        f"| P95 Latency | {latency.get('p95', 0):.2f}ms |",
-        "",
-        "---",
-        "",
-        "## Top Triggered Rules",
-        "",
-    ])
+    total_requests = get_total_requests(prometheus_url, prefetched=prefetched)
+    total_blocked = get_total_blocked(prometheus_url, prefetched=prefetched)
+    block_rate = get_block_rate(prometheus_url, prefetched=prefetched)
+    latency = get_latency_stats(prometheus_url, prefetched=prefetched)
+
+    write(
+        _SUMMARY_TABLE.format(
+            total_requests=total_requests,
+            total_blocked=total_blocked,
+            block_rate=block_rate,
+            avg=latency.get("avg", 0),
+            p95=latency.get("p95", 0),
+        )
+    )
 
     # Top rules
-    top_rules = get_top_rules(prometheus_url)
+    top_rules = get_top_rules(prometheus_url, prefetched=prefetched)
     if top_rules:
-        lines.extend([
-            "| Rank | Rule ID | Count |",
-            "|------|---------|-------|",
-        ])
+        write(_RULE_TABLE_HEADER)
         for i, (rule_id, count) in enumerate(top_rules, 1):
-            lines.append(f"| {i} | `{rule_id}` | {int(count):,} |")
+            write(_format_rule_row(i, rule_id, int(count)))
     else:
-        lines.append("*No rule hits recorded*")
-
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Latency Performance",
-        "",
-        "| Percentile | Value |",
-        "|------------|-------|",
-    ])
+        write("*No rule hits recorded*\n")
 
+    write(_LATENCY_HEADER)
     for key, label in [("avg", "Average"), ("p50", "P50"), ("p95", "P95"), ("p99", "P99")]:
-        val = latency.get(key, 0)
-        lines.append(f"| {label} | {val:.2f}ms |")
+        write(_format_latency_row(label, latency.get(key, 0)))
 
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Context Distribution",
-        "",
-    ])
+    write(_CONTEXT_HEADER)
 
     # Context distribution
-    context_dist = get_context_distribution(prometheus_url)
+    context_dist = get_context_distribution(prometheus_url, prefetched=prefetched)
     if context_dist:
-        lines.extend([
-            "| Context Type | Count | Percentage |",
-            "|--------------|-------|------------|",
-        ])
+        write(_CTX_TABLE_HEADER)
         total_ctx = sum(context_dist.values())
         for ctx_type, count in sorted(context_dist.items(), key=lambda x: x[1], reverse=True):
             pct = (count / total_ctx * 100) if total_ctx > 0 else 0
-            lines.append(f"| {ctx_type} | {count:,} | {pct:.1f}% |")
+            write(_format_ctx_row(ctx_type, count, pct))
     else:
-        lines.append("*No context data recorded*")
-
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Explain-Only Detections",
-        "",
-    ])
-
-    explain_only = get_explain_only_count(prometheus_url)
-    lines.extend([
-        f"**Total Explain-Only:** {explain_only:,}",
-        "",
-        "These are findings that were detected but not blocked because they appeared in educational/tutorial context.",
-        "",
-        "---",
-        "",
-        "## ML Pre-Classifier Status",
-        "",
-    ])
-
-    ml_stats = get_ml_stats(prometheus_url)
+        write("*No context data recorded*\n")
+
+    explain_only = get_explain_only_count(prometheus_url, prefetched=prefetched)
+    write(_EXPLAIN_ONLY_SECTION.format(explain_only))
+
+    ml_stats = get_ml_stats(prometheus_url, prefetched=prefetched)
     if ml_stats.get("load"):
-        lines.append("**Model Load Status:**")
+        write("**Model Load Status:**\n")
         for status, count in ml_stats["load"].items():
-            lines.append(f"- {status}: {count}")
+            write(f"- {status}: {count}\n")
     if ml_stats.get("shadow_total"):
-        lines.append(f"\n**Shadow Mode Disagreements:** {ml_stats['shadow_total']}")
-
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Recommendations",
-        "",
-        "Based on this week's data:",
-        "",
-    ])
+        write(f"\n**Shadow Mode Disagreements:** {ml_stats['shadow_total']}\n")
+
+    write(_RECOMMENDATIONS_HEADER)
 
     # Generate recommendations
     recommendations = []
 
     if block_rate > 20:
-        recommendations.append("⚠️ High block rate (>20%). Review top rules for potential false positives.")
+        recommendations.append(
+            "⚠️ High block rate (>20%). Review top rules for potential false positives."
+        )
     if block_rate < 5:
-        recommendations.append("ℹ️ Low block rate (<5%). Consider if detection rules are too permissive.")
+        recommendations.append(
+            "ℹ️ Low block rate (<5%). Consider if detection rules are too permissive."
+        )
     if latency.get("p95", 0) > 50:
         recommendations.append("⚠️ P95 latency >50ms. Consider performance optimization.")
     if explain_only > 0:
-        recommendations.append(f"ℹ️ {explain_only} explain-only detections. Review for ML training data.")
+        recommendations.append(
+            f"ℹ️ {explain_only} explain-only detections. Review for ML training data."
+        )
     if not recommendations:
         recommendations.append("✅ All metrics within normal ranges.")
 
     for rec in recommendations:
-        lines.append(f"- {rec}")
+        write(f"- {rec}\n")
 
-    lines.extend([
-        "",
-        "---",
-        "",
-        f"*Report generated by `scripts/export_weekly_report.py`*",
-    ])
+    write(_REPORT_FOOTER)
 
-    return "\n".join(lines)
+
+def generate_report(
+    prometheus_url: str,
+    days: int = 7,
+    prefetched: dict[str, list[dict[str, Any]]] | None = None,
+) -> str:
+    """Generate the weekly report in Markdown format."""
+    buf = io.StringIO()
+    write_report(prometheus_url, days, buf, prefetched)
+    return buf.getvalue()
 
 
 def main():
@@ -417,26 +604,25 @@ def main():
         default=7,
         help="Number of days to include (default: 7)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Prometheus instead of reusing results from the last hour",
+    )
     args = parser.parse_args()
 
-    # Check Prometheus connection
-    try:
-        response = requests.get(f"{args.prometheus_url}/api/v1/status/config", timeout=5)
-        response.raise_for_status()
-    except requests.exceptions.RequestException:
-        print(f"Warning: Cannot connect to Prometheus at {args.prometheus_url}")
-        print("Report will contain default/zero values.")
-
-    # Generate report
-    report = generate_report(args.prometheus_url, args.days)
+    # Check the connection and fetch every query over one async client
+    prefetched = fetch_report_data(args.prometheus_url, use_cache=not args.no_cache)
 
-    # Output
+    # Stream the report to its destination instead of building it in memory
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(report)
+        with args.output.open("w", buffering=64 * 1024, encoding="utf-8") as out:
+            write_report(args.prometheus_url, args.days, out, prefetched)
         print(f"Report saved to: {args.output}")
     else:
-        print(report)
+        write_report(args.prometheus_url, args.days, sys.stdout, prefetched)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
@@ -14,43 +14,50 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import array
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
 
 import joblib
 import numpy as np
+import orjson
 from sklearn import metrics
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
 
 
 LABELS = ("educational", "command", "text")
+_LABEL_IDX = {label: i for i, label in enumerate(LABELS)}
+# Decodes integer predictions/targets back to label strings by fancy indexing
+_LABEL_NAMES = np.asarray(LABELS)
 
 
 @dataclass
 class Dataset:
     texts: list[str]
-    labels: list[str]
+    labels: np.ndarray  # int8 indices into LABELS
 
 
-def read_jsonl(path: Path) -> list[dict]:
-    rows = []
-    with path.open(encoding="utf-8") as f:
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    # One line resident at a time; orjson decodes the UTF-8 bytes itself
+    with path.open("rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            rows.append(json.loads(line))
-    return rows
+            yield orjson.loads(line)
 
 
 def build_dataset(objs: Iterable[dict]) -> Dataset:
     texts: list[str] = []
-    labels: list[str] = []
+    # Row count is unknown while streaming, so grow a compact int8 buffer
+    # instead of holding one Python str reference per row
+    labels = array.array("b")
+    append_text = texts.append
+    append_label = labels.append
 
     for obj in objs:
         label = obj.get("label")
@@ -58,53 +65,77 @@ def build_dataset(objs: Iterable[dict]) -> Dataset:
         seg_type = obj.get("segment_type")
         lang = obj.get("language")
 
-        if label not in LABELS:
+        label_idx = _LABEL_IDX.get(label)
+        if label_idx is None:
             continue  # skip unknown labels
 
         # Inject lightweight tokens for segment and language to help the model.
-        tokens: list[str] = []
+        # Built as one prefix string; no per-row token list.
+        prefix = ""
         if seg_type:
-            tokens.append(f"SEGMENT_{seg_type}")
+            prefix = f"SEGMENT_{seg_type} "
         if lang:
-            tokens.append(f"LANG_{lang}")
+            prefix += f"LANG_{lang} "
 
-        augmented_text = text
-        if tokens:
-            augmented_text = " ".join(tokens) + " " + augmented_text
+        append_text(prefix + text if prefix else text)
+        append_label(label_idx)
 
-        texts.append(augmented_text)
-        labels.append(label)
+    return Dataset(texts=texts, labels=np.frombuffer(labels, dtype=np.int8))
 
-    return Dataset(texts=texts, labels=labels)
 
-
-def train_model(train_ds: Dataset, min_df: int, max_features: int) -> Pipeline:
-    vectorizer = TfidfVectorizer(
-        ngram_range=(1, 2),
-        min_df=min_df,
-        max_features=max_features,
-        sublinear_tf=True,
-    )
+def train_model(
+    train_ds: Dataset,
+    min_df: int,
+    max_features: int,
+    vectorizer_kind: str = "tfidf",
+    n_features: int = 2**18,
+) -> Pipeline:
     clf = LogisticRegression(
         max_iter=200,
         class_weight="balanced",
         n_jobs=-1,
     )
-    pipe = Pipeline(
-        [
-            ("tfidf", vectorizer),
-            ("clf", clf),
+    if vectorizer_kind == "hashing":
+        # Stateless hashing keeps no vocabulary dict, which dominates peak memory
+        # on large corpora once bigrams and SEGMENT_/LANG_ tokens are counted
+        clf.set_params(solver="saga")  # Efficient on the large sparse CSR input
+        steps = [
+            (
+                "hash",
+                HashingVectorizer(
+                    n_features=n_features,
+                    ngram_range=(1, 2),
+                    alternate_sign=False,
+                    norm=None,
+                ),
+            ),
+            ("tfidf", TfidfTransformer(sublinear_tf=True)),
         ]
-    )
-    pipe.fit(train_ds.texts, train_ds.labels)
+    else:
+        steps = [
+            (
+                "tfidf",
+                TfidfVectorizer(
+                    ngram_range=(1, 2),
+                    min_df=min_df,
+                    max_features=max_features,
+                    sublinear_tf=True,
+                ),
+            ),
+        ]
+    pipe = Pipeline([*steps, ("clf", clf)])
+    # Labels stay int8 in the Dataset and are decoded to a NumPy string array only
+    # here, so the fitted model predicts label names for the runtime pre-classifier
+    pipe.fit(train_ds.texts, _LABEL_NAMES[train_ds.labels])
     return pipe
 
 
 def evaluate(model: Pipeline, ds: Dataset) -> dict:
     preds = model.predict(ds.texts)
-    acc = metrics.accuracy_score(ds.labels, preds)
-    f1_macro = metrics.f1_score(ds.labels, preds, average="macro")
-    report = metrics.classification_report(ds.labels, preds, labels=LABELS, output_dict=True)
+    y_true = _LABEL_NAMES[ds.labels]
+    acc = metrics.accuracy_score(y_true, preds)
+    f1_macro = metrics.f1_score(y_true, preds, average="macro")
+    report = metrics.classification_report(y_true, preds, labels=LABELS, output_dict=True)
     return {
         "accuracy": acc,
         "f1_macro": f1_macro,
@@ -112,13 +143,25 @@ def evaluate(model: Pipeline, ds: Dataset) -> dict:
     }
 
 
-def save_model(model: Pipeline, output: Path, metadata: dict) -> None:
+# joblib `compress` values per --compress choice. Compressed artifacts need the
+# codec (lz4 is a separate package) wherever the service loads the model.
+COMPRESSION = {"none": 0, "zlib": ("zlib", 3), "lz4": ("lz4", 3)}
+
+
+def save_model(model: Pipeline, output: Path, metadata: dict, compress: str = "none") -> None:
     output.parent.mkdir(parents=True, exist_ok=True)
+    # predict() computes X @ coef_.T on sparse X; with a C-ordered coef_ the
+    # transpose is non-contiguous and gets copied on every call. Storing coef_
+    # in Fortran order makes coef_.T C-contiguous, and pickle keeps the layout.
+    clf = model.named_steps["clf"]
+    clf.coef_ = np.asfortranarray(clf.coef_)
+    clf.intercept_ = np.ascontiguousarray(clf.intercept_)
     payload = {
         "model": model,
         "metadata": metadata,
     }
-    joblib.dump(payload, output)
+    # Protocol 5 pickles the NumPy arrays as out-of-band buffers, without an extra copy
+    joblib.dump(payload, output, compress=COMPRESSION[compress], protocol=5)
 
 
 def main() -> None:
@@ -126,27 +169,54 @@ def main() -> None:
     parser.add_argument("--train", required=True, type=Path, help="Train JSONL file")
     parser.add_argument("--eval", required=True, type=Path, help="Eval JSONL file")
     parser.add_argument("--output", required=True, type=Path, help="Output joblib path")
-    parser.add_argument("--min-df", type=int, default=2, help="Tfidf min_df (default: 2)")
-    parser.add_argument("--max-features", type=int, default=50000, help="Tfidf max_features (default: 50k)")
+    parser.add_argument(
+        "--vectorizer",
+        choices=("tfidf", "hashing"),
+        default="tfidf",
+        help="Feature extractor: classic tfidf or vocabulary-free hashing for large corpora (default: tfidf)",
+    )
+    parser.add_argument("--n-features", type=int, help="Hashing n_features (default: 2^18; hashing only)")
+    parser.add_argument(
+        "--compress",
+        choices=tuple(COMPRESSION),
+        default="none",
+        help="Artifact compression; lz4 must also be installed where the model is served (default: none)",
+    )
+    parser.add_argument("--min-df", type=int, help="Tfidf min_df (default: 2; tfidf only)")
+    parser.add_argument("--max-features", type=int, help="Tfidf max_features (default: 50k; tfidf only)")
     args = parser.parse_args()
 
+    # Reject flags the chosen vectorizer would silently ignore
+    if args.vectorizer == "hashing":
+        if args.min_df is not None or args.max_features is not None:
+            parser.error("--min-df/--max-features only apply to --vectorizer tfidf")
+        args.n_features = args.n_features or 2**18
+    else:
+        if args.n_features is not None:
+            parser.error("--n-features only applies to --vectorizer hashing")
+        args.min_df = 2 if args.min_df is None else args.min_df
+        args.max_features = args.max_features or 50000
+
     if not args.train.exists():
         sys.exit(f"Train file not found: {args.train}")
     if not args.eval.exists():
         sys.exit(f"Eval file not found: {args.eval}")
 
-    train_rows = read_jsonl(args.train)
-    eval_rows = read_jsonl(args.eval)
-
-    train_ds = build_dataset(train_rows)
-    eval_ds = build_dataset(eval_rows)
+    train_ds = build_dataset(iter_jsonl(args.train))
+    eval_ds = build_dataset(iter_jsonl(args.eval))
 
     if not train_ds.texts or not eval_ds.texts:
         sys.exit("Train/eval datasets are empty or invalid.")
 
     print(f"Loaded train: {len(train_ds.texts)} samples, eval: {len(eval_ds.texts)} samples")
 
-    model = train_model(train_ds, min_df=args.min_df, max_features=args.max_features)
+    model = train_model(
+        train_ds,
+        min_df=args.min_df,
+        max_features=args.max_features,
+        vectorizer_kind=args.vectorizer,
+        n_features=args.n_features,
+    )
     metrics_eval = evaluate(model, eval_ds)
 
     print("\nEval metrics:")
@@ -163,6 +233,9 @@ def main() -> None:
 
     metadata = {
         "labels": LABELS,
+        "vectorizer": args.vectorizer,
+        "n_features": args.n_features,
+        "compress": args.compress,
         "min_df": args.min_df,
         "max_features": args.max_features,
         "train_samples": len(train_ds.texts),
@@ -173,7 +246,7 @@ def main() -> None:
         },
     }
 
-    save_model(model, args.output, metadata)
+    save_model(model, args.output, metadata, compress=args.compress)
     print(f"\nSaved model to: {args.output}")
 
 
@@ -8,17 +8,43 @@ Usage:
 """
 
 import argparse
-import json
-import random
+import re
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 
 VALID_LABELS = {"educational", "command", "text"}
 VALID_SEGMENT_TYPES = {"code", "text"}
 VALID_LANGUAGES = {"en", "de", "tr", "es", "fr", "zh", "ru", "pt", "ja", "ko"}
 
+# Educational samples should contain at least one of these; command samples none
+EDU_KEYWORDS = ["warning", "never", "dangerous", "example", "caution",
+                "avoid", "do not run", "unsafe", "malicious", "tutorial",
+                "warnung", "niemals", "uyarı", "asla", "advertencia",
+                "nunca", "avertissement", "jamais", "警告", "切勿"]
+CMD_WARNING_KEYWORDS = ["warning", "never", "dangerous", "caution", "avoid",
+                        "do not run", "unsafe", "example of", "demonstrates"]
+
+
+# Below this many input files, validation runs in-process
+PARALLEL_MIN_FILES = 4
+
+
+def _keyword_regex(keywords: list[str]) -> re.Pattern[str]:
+    # One alternation scans the text once, case-insensitively, without a lowered copy.
+    # re's case folding also pairs dotless ı with I, so "UYARI" matches "uyarı",
+    # which a str.lower() comparison misses.
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+_EDU_RE = _keyword_regex(EDU_KEYWORDS)
+_CMD_WARN_RE = _keyword_regex(CMD_WARNING_KEYWORDS)
+
 
 def validate_sample(sample: dict, line_num: int, filename: str) -> list[str]:
     """Validate a single sample and return list of errors."""
@@ -45,61 +71,67 @@ def validate_sample(sample: dict, line_num: int, filename: str) -> list[str]:
         errors.append(f"Invalid language '{sample['language']}', must be one of {VALID_LANGUAGES}")
 
     # Content validation
-    if "text" in sample and "label" in sample:
-        text_lower = sample["text"].lower()
-
+    if "text" in sample and "label" in sample and isinstance(sample["text"], str):
         # Educational samples should have warning keywords
         if sample["label"] == "educational":
-            edu_keywords = ["warning", "never", "dangerous", "example", "caution",
-                          "avoid", "do not run", "unsafe", "malicious", "tutorial",
-                          "warnung", "niemals", "uyarı", "asla", "advertencia",
-                          "nunca", "avertissement", "jamais", "警告", "切勿"]
-            has_keyword = any(kw in text_lower for kw in edu_keywords)
-            if not has_keyword:
+            if _EDU_RE.search(sample["text"]) is None:
                 errors.append(f"Educational sample missing warning keywords")
 
         # Command samples should NOT have warning keywords
         if sample["label"] == "command":
-            warning_keywords = ["warning", "never", "dangerous", "caution", "avoid",
-                              "do not run", "unsafe", "example of", "demonstrates"]
-            has_warning = any(kw in text_lower for kw in warning_keywords)
-            if has_warning:
+            if _CMD_WARN_RE.search(sample["text"]) is not None:
                 errors.append(f"Command sample contains warning keywords (should be educational?)")
 
     return errors
 
 
+# Blank lines and markdown formatting (fences, headings) that might have been included
+_SKIP_LINE_RE = re.compile(rb"\s*(?:```|#|$)")
+
+
 def validate_file(filepath: Path) -> tuple[list[dict], list[str]]:
     """Validate a JSONL file and return valid samples and errors."""
     valid_samples = []
     all_errors = []
 
-    with open(filepath, encoding="utf-8") as f:
-        lines = f.readlines()
+    # Iterate the file directly so only the current line is held, not the whole file.
+    # Lines stay bytes: orjson decodes UTF-8 itself, so no str is built
+    # for blank or skipped lines.
+    with open(filepath, "rb") as f:
+        for i, line in enumerate(f, 1):
+            if _SKIP_LINE_RE.match(line):
+                continue
+
+            try:
+                sample = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                all_errors.append(f"{filepath}:{i}: JSON parse error: {e}")
+                continue
+
+            errors = validate_sample(sample, i, str(filepath))
+            if errors:
+                for error in errors:
+                    all_errors.append(f"{filepath}:{i}: {error}")
+            else:
+                valid_samples.append(sample)
 
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
+    return valid_samples, all_errors
 
-        # Skip markdown formatting that might have been included
-        if line.startswith("```") or line.startswith("#"):
-            continue
 
-        try:
-            sample = json.loads(line)
-        except json.JSONDecodeError as e:
-            all_errors.append(f"{filepath}:{i}: JSON parse error: {e}")
-            continue
+# Lines handed to each writelines() call; bounds the transient list of joined bytes
+WRITE_CHUNK_LINES = 10_000
 
-        errors = validate_sample(sample, i, str(filepath))
-        if errors:
-            for error in errors:
-                all_errors.append(f"{filepath}:{i}: {error}")
-        else:
-            valid_samples.append(sample)
 
-    return valid_samples, all_errors
+def encode_jsonl(samples: list[dict]) -> list[bytes]:
+    """Serialize samples to newline-terminated UTF-8 JSON lines."""
+    return [orjson.dumps(sample) + b"\n" for sample in samples]
+
+
+def write_jsonl(path: Path, lines: list[bytes]) -> None:
+    """Write pre-encoded JSONL lines through a 1 MiB buffer."""
+    with open(path, "wb", buffering=1 << 20) as f:
+        for start in range(0, len(lines), WRITE_CHUNK_LINES):
+            f.writelines(lines[start : start + WRITE_CHUNK_LINES])
 
 
 def print_stats(samples: list[dict]) -> None:
@@ -133,6 +165,7 @@ def main():
     parser.add_argument("--combine", "-c", action="store_true", help="Combine all valid samples")
     parser.add_argument("--output", "-o", help="Output file for combined data")
     parser.add_argument("--split", type=float, default=0.8, help="Train/eval split ratio (default: 0.8)")
+    parser.add_argument("--seed", type=int, default=0, help="Shuffle seed for --combine (default: 0)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed errors")
     args = parser.parse_args()
 
@@ -153,12 +186,22 @@ def main():
     all_errors = []
 
     print("🔍 Validating files...")
+    existing_files = []
     for filepath in input_files:
-        if not filepath.exists():
+        if filepath.exists():
+            existing_files.append(filepath)
+        else:
             print(f"   ⚠️  {filepath}: File not found")
-            continue
 
-        samples, errors = validate_file(filepath)
+    # Files are independent and validation is GIL-bound, so use processes;
+    # for a handful of files the pool start-up would cost more than it saves
+    if len(existing_files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as pool:
+            file_results = list(pool.map(validate_file, existing_files))
+    else:
+        file_results = [validate_file(filepath) for filepath in existing_files]
+
+    for filepath, (samples, errors) in zip(existing_files, file_results, strict=True):
         all_samples.extend(samples)
         all_errors.extend(errors)
 
@@ -188,36 +231,34 @@ def main():
         if not args.output:
             args.output = "data/ml_training/preclf_combined.jsonl"
 
-        # Shuffle samples
-        random.shuffle(all_samples)
+        # Shuffle via a seeded index permutation: reproducible splits, and the
+        # swaps happen in a NumPy int array rather than on the list of dicts
+        perm = np.random.default_rng(args.seed).permutation(len(all_samples))
+        all_samples = [all_samples[i] for i in perm.tolist()]
 
-        # Split into train/eval
+        # Split into train/eval; every sample is encoded once and its bytes
+        # shared between the combined file and whichever split it lands in
         split_idx = int(len(all_samples) * args.split)
-        train_samples = all_samples[:split_idx]
-        eval_samples = all_samples[split_idx:]
+        lines = encode_jsonl(all_samples)
+        train_lines = lines[:split_idx]
+        eval_lines = lines[split_idx:]
 
         # Save combined file
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for sample in all_samples:
-                f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+        write_jsonl(output_path, lines)
         print(f"\n💾 Saved combined data to: {output_path}")
 
         # Save train/eval splits
         train_path = output_path.parent / "preclf_train.jsonl"
         eval_path = output_path.parent / "preclf_eval.jsonl"
 
-        with open(train_path, "w", encoding="utf-8") as f:
-            for sample in train_samples:
-                f.write(json.dumps(sample, ensure_ascii=False) + "\n")
-        print(f"   Train set: {train_path} ({len(train_samples)} samples)")
+        write_jsonl(train_path, train_lines)
+        print(f"   Train set: {train_path} ({len(train_lines)} samples)")
 
-        with open(eval_path, "w", encoding="utf-8") as f:
-            for sample in eval_samples:
-                f.write(json.dumps(sample, ensure_ascii=False) + "\n")
-        print(f"   Eval set: {eval_path} ({len(eval_samples)} samples)")
+        write_jsonl(eval_path, eval_lines)
+        print(f"   Eval set: {eval_path} ({len(eval_lines)} samples)")
 
     print("\n✅ Validation complete!")
 
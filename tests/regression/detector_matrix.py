@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Any
 
-from app.pipeline import GuardRequest, run_pipeline
+from app.pipeline import GuardRequest, run_pipeline_batch
 from app.settings import Settings
 from tests.regression.placeholders import apply_placeholders
 
@@ -81,19 +82,27 @@ SCENARIOS: list[Scenario] = [
 ]
 
 
+@functools.cache
+def _rendered_scenarios() -> tuple[tuple[Scenario, str], ...]:
+    """Scenarios paired with their placeholder-rendered text, built once per process."""
+
+    return tuple((scenario, apply_placeholders(scenario.response)) for scenario in SCENARIOS)
+
+
 def run_matrix(settings: Settings) -> list[dict[str, Any]]:
     """Execute detector scenarios via pipeline and return raw results."""
 
+    rendered_scenarios = _rendered_scenarios()
+    pipeline_results = run_pipeline_batch(
+        (
+            GuardRequest(response=rendered, metadata=scenario.metadata)
+            for scenario, rendered in rendered_scenarios
+        ),
+        settings=settings,
+    )
+
     results: list[dict[str, Any]] = []
-    for scenario in SCENARIOS:
-        rendered = apply_placeholders(scenario.response)
-        result = run_pipeline(
-            GuardRequest(
-                response=rendered,
-                metadata=scenario.metadata,
-            ),
-            settings=settings,
-        )
+    for (scenario, _), result in zip(rendered_scenarios, pipeline_results, strict=True):
         payload = result.asdict()
         payload["blocked"] = result.blocked
         payload["scenario"] = scenario.name
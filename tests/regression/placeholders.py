@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import base64
 import json
-from collections.abc import Callable
+import re
 from hashlib import sha256
 
 
@@ -133,48 +133,50 @@ def _jwt_token(subject: str) -> str:
     return ".".join([header_b64, payload_b64, signature])
 
 
-PLACEHOLDER_FACTORIES: dict[str, Callable[[], str]] = {
-    "{{STRIPE_KEY}}": _stripe_key,
-    "{{TWILIO_KEY}}": _twilio_key,
-    "{{SLACK_TOKEN}}": _slack_token,
-    "{{OPENAI_LIVE_KEY}}": _openai_live_key,
-    "{{OPENAI_PROJECT_KEY}}": _openai_project_key,
-    "{{GITHUB_PAT}}": _github_pat,
-    "{{GITHUB_HIGH_ENTROPY}}": _github_high_entropy,
-    "{{AWS_ACCESS_KEY}}": _aws_access_key,
-    "{{AWS_SECRET_KEY}}": _aws_secret_key,
-    "{{AZURE_SAS_URL}}": _azure_sas_url,
-    "{{PEM_PRIVATE_BLOCK}}": _pem_block,
-    "{{PEM_PRIVATE_SNIPPET}}": _pem_snippet,
-    "{{GCP_SA_JSON}}": _gcp_sa_json,
-    "{{HIGH_ENTROPY_TOKEN}}": _high_entropy_token,
-    "{{JWT_ACCESS_TOKEN}}": lambda: _jwt_token("access-user"),
-    "{{JWT_SAMPLE_TOKEN}}": lambda: _jwt_token("sample-user"),
+# Computed once at import: every input is constant, and concurrent callers only read it
+PLACEHOLDER_VALUES: dict[str, str] = {
+    "{{STRIPE_KEY}}": _stripe_key(),
+    "{{TWILIO_KEY}}": _twilio_key(),
+    "{{SLACK_TOKEN}}": _slack_token(),
+    "{{OPENAI_LIVE_KEY}}": _openai_live_key(),
+    "{{OPENAI_PROJECT_KEY}}": _openai_project_key(),
+    "{{GITHUB_PAT}}": _github_pat(),
+    "{{GITHUB_HIGH_ENTROPY}}": _github_high_entropy(),
+    "{{AWS_ACCESS_KEY}}": _aws_access_key(),
+    "{{AWS_SECRET_KEY}}": _aws_secret_key(),
+    "{{AZURE_SAS_URL}}": _azure_sas_url(),
+    "{{PEM_PRIVATE_BLOCK}}": _pem_block(),
+    "{{PEM_PRIVATE_SNIPPET}}": _pem_snippet(),
+    "{{GCP_SA_JSON}}": _gcp_sa_json(),
+    "{{HIGH_ENTROPY_TOKEN}}": _high_entropy_token(),
+    "{{JWT_ACCESS_TOKEN}}": _jwt_token("access-user"),
+    "{{JWT_SAMPLE_TOKEN}}": _jwt_token("sample-user"),
 }
 
-PLACEHOLDER_CACHE: dict[str, str] = {}
+_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in PLACEHOLDER_VALUES))
+
+
+def _marker_value(match: re.Match[str]) -> str:
+    return PLACEHOLDER_VALUES[match.group(0)]
 
 
 def apply_placeholders(text: str) -> str:
     """Replace placeholder markers inside a text blob with synthetic secrets."""
 
-    result = text
-    for marker, factory in PLACEHOLDER_FACTORIES.items():
-        if marker not in result:
-            continue
-        value = PLACEHOLDER_CACHE.setdefault(marker, factory())
-        result = result.replace(marker, value)
-    return result
+    # Most inputs carry no markers at all
+    if "{{" not in text:
+        return text
+    return _MARKER_RE.sub(_marker_value, text)
 
 
 def get_placeholder(name: str) -> str:
     """Return the concrete value for a specific placeholder marker."""
 
     marker = name if name.startswith("{{") else f"{{{{{name}}}}}"
-    factory = PLACEHOLDER_FACTORIES.get(marker)
-    if not factory:
-        raise KeyError(f"Unknown placeholder {name}")
-    return PLACEHOLDER_CACHE.setdefault(marker, factory())
+    try:
+        return PLACEHOLDER_VALUES[marker]
+    except KeyError:
+        raise KeyError(f"Unknown placeholder {name}") from None
 
 
 __all__ = ["apply_placeholders", "get_placeholder"]
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from hashlib import blake2b
 from pathlib import Path
 
+import orjson
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
@@ -23,7 +29,11 @@ from tests.regression.placeholders import apply_placeholders  # noqa: E402
 @dataclass(slots=True)
 class GoldenExpectation:
     blocked: bool
-    rule_ids: list[str]
+    rule_ids: tuple[str, ...]  # Sorted at load; compared as-is against scan results
+
+
+# Set once per worker process by _init_worker
+_WORKER_SETTINGS: Settings | None = None
 
 
 def main() -> None:
@@ -52,6 +62,12 @@ def main() -> None:
         action="store_true",
         help="Rewrite golden_v1.jsonl and golden_manifest.json with current outputs.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for the golden corpus scan (1 runs in-process).",
+    )
     args = parser.parse_args()
 
     corpus_dir = Path(__file__).parent / "corpus_v1"
@@ -61,7 +77,13 @@ def main() -> None:
         raise SystemExit("Golden file not found. Generate it before running regression tests.")
 
     settings = Settings()
-    _run_golden_suite(corpus_dir, golden_file, settings, update_golden=args.update_golden)
+    _run_golden_suite(
+        corpus_dir,
+        golden_file,
+        settings,
+        update_golden=args.update_golden,
+        workers=args.workers,
+    )
 
     if args.matrix_report:
         _run_matrix_reports(settings, args.matrix_json, args.matrix_markdown)
@@ -73,46 +95,52 @@ def _run_golden_suite(
     settings: Settings,
     *,
     update_golden: bool = False,
+    workers: int = 1,
 ) -> None:
     golden = _load_golden(golden_file)
     failures: list[str] = []
     processed = 0
     new_records: list[dict[str, object]] = []
 
-    for sample_path in sorted(corpus_dir.rglob("*.txt")):
-        rel_path = sample_path.relative_to(corpus_dir).as_posix()
+    # One walk of the corpus serves both the scan and the missing-sample check
+    samples = {
+        sample_path.relative_to(corpus_dir).as_posix(): sample_path
+        for sample_path in sorted(corpus_dir.rglob("*.txt"))
+    }
+    # Reading is cheap next to the detectors, so load every sample up front and let
+    # the workers drain one shared list
+    render = apply_placeholders
+    items = [
+        (rel_path, render(sample_path.read_text(encoding="utf-8")))
+        for rel_path, sample_path in samples.items()
+    ]
+
+    for rel_path, blocked, actual_rules in _scan_samples(items, settings, workers):
         expected = golden.get(rel_path)
         if not expected and not update_golden:
             failures.append(f"Missing golden expectation for {rel_path}")
 
-        text = sample_path.read_text(encoding="utf-8")
-        text = apply_placeholders(text)
-        result = run_pipeline(GuardRequest(response=text), settings=settings)
         processed += 1
 
-        actual_rules = sorted(f.rule_id for f in result.findings)
         new_records.append(
             {
                 "sample": rel_path,
-                "blocked": bool(result.blocked),
+                "blocked": blocked,
                 "rule_ids": actual_rules,
             }
         )
 
         if expected:
-            expected_rules = sorted(expected.rule_ids)
+            if blocked != expected.blocked:
+                failures.append(f"{rel_path}: blocked={blocked} (expected {expected.blocked})")
 
-            if result.blocked != expected.blocked:
+            # Sorted tuples rather than sets: duplicate findings of a rule must match too
+            if actual_rules != expected.rule_ids:
                 failures.append(
-                    f"{rel_path}: blocked={result.blocked} (expected {expected.blocked})"
+                    f"{rel_path}: rules {list(actual_rules)} != expected {list(expected.rule_ids)}"
                 )
 
-            if actual_rules != expected_rules:
-                failures.append(f"{rel_path}: rules {actual_rules} != expected {expected_rules}")
-
-    missing_samples = set(golden) - {
-        path.relative_to(corpus_dir).as_posix() for path in corpus_dir.rglob("*.txt")
-    }
+    missing_samples = golden.keys() - samples.keys()
     if not update_golden:
         for sample in sorted(missing_samples):
             failures.append(f"Golden expectation has no sample: {sample}")
@@ -128,6 +156,48 @@ def _run_golden_suite(
         print(f"Regression suite passed for {processed} samples.")
 
 
+def _scan_samples(
+    items: list[tuple[str, str]], settings: Settings, workers: int
+) -> Iterator[tuple[str, bool, tuple[str, ...]]]:
+    """Run the pipeline over ``items``, yielding results in input order.
+
+    Samples whose rendered text is identical are scanned once and share the result.
+    """
+
+    keys = [blake2b(text.encode("utf-8"), digest_size=16).digest() for _, text in items]
+    unique: dict[bytes, str] = {}
+    for key, (_, text) in zip(keys, items, strict=True):
+        unique.setdefault(key, text)
+
+    results = dict(zip(unique, _scan_texts(list(unique.values()), settings, workers), strict=True))
+    for (rel_path, _), key in zip(items, keys, strict=True):
+        blocked, actual_rules = results[key]
+        yield rel_path, blocked, actual_rules
+
+
+def _scan_texts(
+    texts: list[str], settings: Settings, workers: int
+) -> Iterator[tuple[bool, tuple[str, ...]]]:
+    if workers <= 1:
+        _init_worker(settings)
+        yield from map(_scan_one, texts)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(settings,)
+    ) as executor:
+        yield from executor.map(_scan_one, texts, chunksize=16)
+
+
+def _init_worker(settings: Settings) -> None:
+    global _WORKER_SETTINGS
+    _WORKER_SETTINGS = settings
+
+
+def _scan_one(text: str) -> tuple[bool, tuple[str, ...]]:
+    result = run_pipeline(GuardRequest(response=text), settings=_WORKER_SETTINGS)
+    return bool(result.blocked), tuple(sorted(f.rule_id for f in result.findings))
+
+
 def _run_matrix_reports(settings: Settings, json_path: Path, markdown_path: Path) -> None:
     results = run_matrix(settings)
     json_path.parent.mkdir(parents=True, exist_ok=True)
@@ -148,24 +218,26 @@ def _run_matrix_reports(settings: Settings, json_path: Path, markdown_path: Path
         "exfil-hex": "Hex payload below limits; benign, but keep sample for tuning.",
     }
 
-    lines = [
-        "# Detector Matrix Analysis",
-        "",
-        f"_Generated at {datetime.now(UTC).isoformat()}Z_",
-        "",
-        "| Scenario | Blocked | Risk | Rules | Actions | Notes |",
-        "|----------|---------|------|-------|---------|-------|",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        "# Detector Matrix Analysis\n"
+        "\n"
+        f"_Generated at {datetime.now(UTC).isoformat()}Z_\n"
+        "\n"
+        "| Scenario | Blocked | Risk | Rules | Actions | Notes |\n"
+        "|----------|---------|------|-------|---------|-------|\n"
+    )
     for payload in results:
         findings = payload["findings"]
         rule_list = ", ".join(sorted({f["rule_id"] for f in findings})) or "-"
         action_list = ", ".join(sorted({f["action"] for f in findings})) or "-"
         note = "High risk" if payload["blocked"] else "Allowed/masked"
-        lines.append(
-            f"| {payload['scenario']} | {payload['blocked']} | {payload['risk_score']} | {rule_list} | {action_list} | {note} |"
+        write(
+            f"| {payload['scenario']} | {payload['blocked']} | {payload['risk_score']} | {rule_list} | {action_list} | {note} |\n"
         )
 
-    lines.extend(["", "## Analyst Notes", ""])
+    write("\n## Analyst Notes\n\n")
     seen: set[str] = set()
     for payload in results:
         scenario = payload["scenario"]
@@ -175,49 +247,48 @@ def _run_matrix_reports(settings: Settings, json_path: Path, markdown_path: Path
         note = analyst_notes.get(
             scenario, "Review context with tenant; no automated action defined."
         )
-        lines.append(f"- **{scenario}** – {note}")
-
-    lines.extend(
-        [
-            "",
-            "## Detailed Findings",
-            "",
-            "| Scenario | Rule ID | Action | Type | Preview | Metadata |",
-            "|----------|---------|--------|------|---------|----------|",
-        ]
+        write(f"- **{scenario}** – {note}\n")
+
+    write(
+        "\n"
+        "## Detailed Findings\n"
+        "\n"
+        "| Scenario | Rule ID | Action | Type | Preview | Metadata |\n"
+        "|----------|---------|--------|------|---------|----------|\n"
     )
     for payload in results:
         findings = payload["findings"]
         meta = payload.get("metadata") or {}
         meta_str = ", ".join(f"{k}={v}" for k, v in meta.items()) or "-"
         if not findings:
-            lines.append(f"| {payload['scenario']} | - | - | - | - | {meta_str} |")
+            write(f"| {payload['scenario']} | - | - | - | - | {meta_str} |\n")
             continue
         for finding in findings:
             detail = finding.get("detail") or {}
             preview = detail.get("preview") or "-"
-            line = (
+            write(
                 f"| {payload['scenario']} | {finding.get('rule_id')} | "
-                f"{finding.get('action')} | {finding.get('type')} | {preview} | {meta_str} |"
+                f"{finding.get('action')} | {finding.get('type')} | {preview} | {meta_str} |\n"
             )
-            lines.append(line)
 
     markdown_path.parent.mkdir(parents=True, exist_ok=True)
-    markdown_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    markdown_path.write_text(buf.getvalue(), encoding="utf-8")
     print(f"Detector matrix saved to {json_path} and {markdown_path}.")
 
 
 def _load_golden(path: Path) -> dict[str, GoldenExpectation]:
     expectations: dict[str, GoldenExpectation] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        payload = json.loads(line)
-        sample = payload["sample"]
-        expectations[sample] = GoldenExpectation(
-            blocked=bool(payload.get("blocked", False)),
-            rule_ids=list(payload.get("rule_ids", [])),
-        )
+    # Binary lines go straight to orjson, which decodes UTF-8 itself
+    with path.open("rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            payload = orjson.loads(line)
+            sample = payload["sample"]
+            expectations[sample] = GoldenExpectation(
+                blocked=bool(payload.get("blocked", False)),
+                rule_ids=tuple(sorted(payload.get("rule_ids", ()))),
+            )
     return expectations
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from app.main import create_app
-from app.settings import Settings, get_settings
+from app.settings import Settings, SettingsSnapshot, get_settings
 from fastapi.testclient import TestClient
 
 
@@ -53,3 +53,33 @@ def test_guard_delinks_risky_url() -> None:
     assert body["blocked"] is False
     assert "[redacted-url]" in body["response"]
     assert any(f["rule_id"] == "URL-SHORTENER" for f in body["findings"])
+
+
+def test_guard_batch_returns_one_result_per_input_in_order() -> None:
+    client = get_client()
+    resp = client.post(
+        "/guard/batch",
+        json={
+            "responses": ["Reach out via jane.doe@example.com", "Try https://bit.ly/abcd1234 now"]
+        },
+    )
+    body = resp.json()
+
+    assert resp.status_code == 200
+    assert len(body) == 2
+    assert any(f["rule_id"] == "PII-EMAIL" for f in body[0]["findings"])
+    assert any(f["rule_id"] == "URL-SHORTENER" for f in body[1]["findings"])
+
+
+def test_guard_batch_rejects_empty_batch() -> None:
+    client = get_client()
+    resp = client.post("/guard/batch", json={"responses": []})
+
+    assert resp.status_code == 422
+
+
+def test_settings_snapshot_mirrors_every_setting() -> None:
+    snapshot = Settings().snapshot()
+
+    assert set(SettingsSnapshot.__dataclass_fields__) == set(Settings.model_fields)
+    assert snapshot.policy_path == snapshot.policy_file
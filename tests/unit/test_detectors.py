@@ -5,14 +5,16 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
-from app.detectors import cmd, exfil, pii, secrets, url
-from app.pipeline import GuardRequest, run_pipeline
+from app import pipeline
+from app.detectors import cmd, common, exfil, pii, secrets, url
+from app.pipeline import GuardRequest, clear_pipeline_cache, run_pipeline
 from app.policy import AllowlistEntry, PolicyDefinition, PolicyRule
 
 
 @dataclass(slots=True)
 class DummySettings:
     policy_path: Path = Path("config/policy.yaml")
+    policy_recheck_interval_seconds: float = 0.0
     model_version: str = "test"
     feature_ml_preclf: bool = False  # Disable ML for predictable test behavior
     feature_ml_validator: bool = False  # Disable spaCy validator in unit tests
@@ -22,6 +24,8 @@ class DummySettings:
     preclf_manifest_path: Path = Path("models/preclf_v1.manifest.json")
     enforce_model_integrity: bool = False  # Disable for tests
     allow_explain_only_bypass: bool = False
+    enable_pipeline_cache: bool = False
+    pipeline_cache_size: int = 2048
 
 
 def build_policy(
@@ -112,6 +116,28 @@ def test_pipeline_blocks_on_secret() -> None:
     assert "Response blocked" in result.response
 
 
+def test_pipeline_cache_reuses_result_for_identical_request() -> None:
+    clear_pipeline_cache()
+    settings = DummySettings(enable_pipeline_cache=True)
+    request = GuardRequest(response="Contact admin@example.com today.", metadata={"tenant": "a"})
+
+    first = run_pipeline(request, settings=settings)
+    second = run_pipeline(request, settings=settings)
+    first.findings[0].detail["masked"] = "tampered"
+    third = run_pipeline(request, settings=settings)
+    run_pipeline(
+        GuardRequest(response=request.response, metadata={"tenant": "b"}), settings=settings
+    )
+    cached_entries = len(pipeline._PIPELINE_CACHE)
+    clear_pipeline_cache()
+
+    assert second.response == first.response
+    assert second.findings is not first.findings
+    assert third.findings == second.findings
+    assert third.findings[0].detail["masked"] != "tampered"
+    assert cached_entries == 2
+
+
 def test_pii_pan_detection_blocks_card() -> None:
     policy = build_policy([PolicyRule(id="PII-PAN", type="pii", action="block", kind="pan")])
 
@@ -173,3 +199,10 @@ def test_exfil_detector_flags_large_base64() -> None:
     findings = exfil.scan(payload, policy=policy)
 
     assert findings and findings[0].action == "block"
+
+
+def test_shannon_entropy_counts_bits_per_character() -> None:
+    assert common.shannon_entropy("") == 0.0
+    assert common.shannon_entropy("aaaa") == 0.0
+    assert common.shannon_entropy("abab") == 1.0
+    assert common.shannon_entropy("abcdefgh") == 3.0
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+from app import policy
+from app.pipeline import Finding
+
+POLICY_TEMPLATE = """
+rules:
+  - id: {rule_id}
+    type: pii
+    kind: email
+    action: mask
+"""
+
+
+def write_policy(path: Path, rule_id: str, *, mtime: float) -> None:
+    path.write_text(POLICY_TEMPLATE.format(rule_id=rule_id), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_policy_skips_mtime_check_within_interval(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(policy, "Observer", None)
+    policy_file = tmp_path / "policy.yaml"
+    write_policy(policy_file, "PII-ONE", mtime=1_000_000)
+    policy.invalidate_policy_cache(policy_file)
+
+    first = policy.load_policy(policy_file)
+    write_policy(policy_file, "PII-TWO", mtime=2_000_000)
+
+    assert policy.load_policy(policy_file) is first
+
+    reloaded = policy.load_policy(policy_file, recheck_interval=0.0)
+    policy.invalidate_policy_cache(policy_file)
+
+    assert reloaded is not first
+    assert [rule.id for rule in policy.select_policy(reloaded, "default").rules] == ["PII-TWO"]
+
+
+def test_load_policy_cache_hit_makes_no_path_syscalls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(policy, "Observer", None)
+    policy_file = tmp_path / "policy.yaml"
+    write_policy(policy_file, "PII-ONE", mtime=1_000_000)
+    policy.invalidate_policy_cache(policy_file)
+    first = policy.load_policy(policy_file)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("cache hit touched the filesystem")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(Path, "resolve", fail)
+        patched.setattr(os, "stat", fail)
+        assert policy.load_policy(policy_file, recheck_interval=60.0) is first
+    policy.invalidate_policy_cache(policy_file)
+
+
+def test_load_policy_reloads_on_watch_event(tmp_path: Path) -> None:
+    pytest.importorskip("watchdog")
+    policy_file = tmp_path / "policy.yaml"
+    write_policy(policy_file, "PII-ONE", mtime=1_000_000)
+
+    first = policy.load_policy(policy_file)
+    assert policy.load_policy(policy_file) is first
+
+    write_policy(policy_file, "PII-TWO", mtime=2_000_000)
+    deadline = time.monotonic() + 5
+    reloaded = first
+    while reloaded is first and time.monotonic() < deadline:
+        time.sleep(0.05)
+        reloaded = policy.load_policy(policy_file)
+    policy.invalidate_policy_cache(policy_file)
+
+    assert [rule.id for rule in policy.select_policy(reloaded, "default").rules] == ["PII-TWO"]
+
+
+def test_evaluate_scores_known_and_unknown_rules() -> None:
+    definition = policy.PolicyDefinition(
+        policy_id="default",
+        tiers="default",
+        rules=[
+            policy.PolicyRule(id="PII-EMAIL", type="pii", action="mask", risk_weight=15),
+            policy.PolicyRule(
+                id="SECRET-JWT", type="secret", action="block", risk_weight=40, safe_message="jwt"
+            ),
+        ],
+    )
+    findings = [
+        Finding(rule_id="PII-EMAIL", action="mask", type="pii"),
+        Finding(rule_id="UNKNOWN", action="mask", type="pii"),
+        Finding(rule_id="SECRET-JWT", action="block", type="secret"),
+    ]
+
+    decision = policy.evaluate(definition, findings=findings)
+
+    assert decision.blocked is True
+    assert decision.risk_score == 15 + policy.DEFAULT_RULE_WEIGHT + 40
+    assert decision.applied_rules == ("PII-EMAIL", "UNKNOWN", "SECRET-JWT")
+    assert decision.safe_message_key == "jwt"
+
+
+def test_policy_collections_are_frozen_with_their_index() -> None:
+    rule = policy.PolicyRule(id="PII-EMAIL", type="pii", action="mask")
+    definition = policy.PolicyDefinition(policy_id="default", tiers="default", rules=[rule])
+
+    assert definition.rules == (rule,)
+    assert isinstance(definition.allowlist, tuple)
+    assert definition.rules_by_id == {"PII-EMAIL": rule}
+    with pytest.raises(AttributeError):
+        definition.rules.append(rule)  # type: ignore[attr-defined]
+
+
+def test_allowlist_entries_are_grouped_by_selectors() -> None:
+    rule = policy.PolicyRule(id="PII-EMAIL", type="pii", action="mask", kind="email")
+    definition = policy.PolicyDefinition(
+        policy_id="default",
+        tiers="default",
+        allowlist=[
+            policy.AllowlistEntry(value="a@example.com", rule_types={"pii"}),
+            policy.AllowlistEntry(regex=re.compile(r"b@example\.com", re.I), rule_types={"pii"}),
+            policy.AllowlistEntry(regex=re.compile(r"(?i)c@example\.com"), rule_types={"pii"}),
+            policy.AllowlistEntry(value="d@example.com", rule_types={"pii"}, tenants={"acme"}),
+        ],
+    )
+
+    assert len(definition.allowlist_groups) == 2
+    assert definition.allowlist_by_type["pii"] == definition.allowlist_groups
+    assert definition.allowlist_any_type == []
+    assert definition.is_allowlisted("a@example.com", rule=rule)
+    assert definition.is_allowlisted("B@EXAMPLE.COM", rule=rule)
+    assert definition.is_allowlisted("C@example.com", rule=rule)
+    assert not definition.is_allowlisted("d@example.com", rule=rule)
+    assert definition.is_allowlisted("d@example.com", rule=rule, tenant="acme")
+
+
+def test_explicitly_empty_allowlist_selectors_do_not_widen_the_entry() -> None:
+    rule = policy.PolicyRule(id="PII-EMAIL", type="pii", action="mask", kind="email")
+    entries = policy._parse_allowlist(
+        [
+            {"value": "a@example.com", "types": ""},
+            {"value": "b@example.com", "types": []},
+            {"value": "c@example.com"},
+        ]
+    )
+    definition = policy.PolicyDefinition(policy_id="default", tiers="default", allowlist=entries)
+
+    assert not definition.is_allowlisted("a@example.com", rule=rule)
+    assert not definition.is_allowlisted("b@example.com", rule=rule)
+    assert definition.is_allowlisted("c@example.com", rule=rule)
+
+
+def test_context_settings_delta_table() -> None:
+    settings = policy.ContextSettings(
+        code_block_penalty=15, explain_only_penalty=25, link_context_bonus=5
+    )
+
+    assert settings.delta("code", "cmd", True) == -25
+    assert settings.delta("code", "secret", False) == -15
+    assert settings.delta("link", "url", False) == 5
+    assert settings.delta("text", "pii", False) == 0
+    assert policy.ContextSettings(enabled=False).delta("code", "cmd", True) == 0
+    with pytest.raises(AttributeError):
+        settings.code_block_penalty = 0  # type: ignore[misc]
+
+
+def test_evaluate_stops_once_block_decision_is_saturated() -> None:
+    definition = policy.PolicyDefinition(
+        policy_id="default",
+        tiers="default",
+        rules=[
+            policy.PolicyRule(
+                id="SECRET-PEM", type="secret", action="block", risk_weight=100, safe_message="pem"
+            ),
+            policy.PolicyRule(id="PII-EMAIL", type="pii", action="mask", safe_message="masked"),
+        ],
+    )
+    findings = [
+        Finding(rule_id="SECRET-PEM", action="block", type="secret"),
+        Finding(rule_id="PII-EMAIL", action="mask", type="pii"),
+    ]
+
+    decision = policy.evaluate(definition, findings=findings)
+
+    assert decision.blocked is True
+    assert decision.risk_score == 100
+    assert decision.safe_message_key == "pem"
+    assert decision.applied_rules == ("SECRET-PEM", "PII-EMAIL")
+
+
+def test_identical_patterns_share_one_compiled_instance() -> None:
+    first = policy.PolicyRule(id="A", type="secret", action="block", pattern=r"sk-[a-z]{8}")
+    second = policy.PolicyRule(id="B", type="secret", action="block", pattern=r"sk-[a-z]{8}")
+
+    assert first.compiled_pattern is second.compiled_pattern
+    assert first.compiled_pattern is not None
+    assert first.compiled_pattern.flags & re.IGNORECASE
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from datetime import datetime
+
+import httpx
+import orjson
+import pytest
+from app.siem.config import SIEMConfig
+from app.siem.connectors import (
+    ElasticsearchConnector,
+    SIEMEvent,
+    SplunkConnector,
+    WebhookConnector,
+)
+from app.siem.manager import SIEMManager
+
+
+def make_event(rule_id: str = "PII-EMAIL") -> SIEMEvent:
+    return SIEMEvent(event_type="finding", rule_id=rule_id, action="mask", severity="medium")
+
+
+def test_elastic_bulk_payload_is_ndjson_bytes() -> None:
+    connector = ElasticsearchConnector(SIEMConfig(SIEM_ELASTIC_INDEX="guard"))
+
+    payload = connector._format_bulk_payload([make_event("A"), make_event("B")])
+
+    assert isinstance(payload, bytes)
+    assert payload.endswith(b"\n")
+    lines = [orjson.loads(line) for line in payload.splitlines()]
+    assert lines[0]["index"]["_index"].startswith("guard-")
+    assert [lines[1]["rule_id"], lines[3]["rule_id"]] == ["A", "B"]
+    assert "@timestamp" in lines[1] and "timestamp" not in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_manager_queues_encoded_fragments() -> None:
+    config = SIEMConfig(
+        SIEM_ENABLED=True, SIEM_CONNECTOR_TYPE="webhook", SIEM_WEBHOOK_URL="http://siem"
+    )
+    manager = SIEMManager(config)
+    connector = WebhookConnector(config)
+    sent: list[list[bytes]] = []
+
+    async def fake_send(fragments: list[bytes]) -> bool:
+        sent.append(fragments)
+        return True
+
+    connector.send_encoded = fake_send  # type: ignore[method-assign]
+    manager._connector = connector
+
+    assert manager.queue_finding(rule_id="PII-EMAIL", action="mask", severity="low")
+    assert isinstance(manager._queue[0], bytes)
+
+    await manager._flush()
+
+    assert [orjson.loads(fragment)["rule_id"] for fragment in sent[0]] == ["PII-EMAIL"]
+    assert manager.metrics.events_sent == 1
+
+
+def test_splunk_event_time_matches_iso_timestamp() -> None:
+    event = make_event()
+
+    formatted = SplunkConnector(SIEMConfig())._format_event(event)
+
+    assert event.timestamp.endswith("Z")
+    assert formatted["time"] == datetime.fromisoformat(event.timestamp).timestamp()
+
+
+@pytest.mark.asyncio
+async def test_manager_consumer_sends_when_batch_fills() -> None:
+    config = SIEMConfig(
+        SIEM_ENABLED=True,
+        SIEM_CONNECTOR_TYPE="webhook",
+        SIEM_WEBHOOK_URL="http://siem",
+        SIEM_BATCH_SIZE=2,
+        SIEM_FLUSH_INTERVAL=60,
+    )
+    manager = SIEMManager(config)
+    connector = WebhookConnector(config)
+    sent: list[int] = []
+
+    async def fake_send(fragments: list[bytes]) -> bool:
+        sent.append(len(fragments))
+        return True
+
+    connector.send_encoded = fake_send  # type: ignore[method-assign]
+    manager._connector = connector
+    manager._running = True
+    manager._flush_task = asyncio.create_task(manager._flush_loop())
+
+    await manager.queue_event(make_event("A"))
+    await manager.queue_event(make_event("B"))
+    await manager.queue_event(make_event("C"))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert sent[0] == 2
+
+    await manager.stop()
+
+    assert sum(sent) == 3
+    assert manager.metrics.events_sent == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_request_stops_on_non_retriable_client_error() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(400 if len(calls) > 1 else 503)
+
+    connector = WebhookConnector(
+        SIEMConfig(SIEM_RETRY_COUNT=5, SIEM_RETRY_DELAY=0.1, SIEM_RETRY_MAX_DELAY=0.1)
+    )
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await connector._retry_request("POST", "http://siem", content=b"{}") is None
+    assert len(calls) == 2
+
+    await connector.disconnect()
+
+
+def test_compact_keys_shorten_event_fields() -> None:
+    connector = ElasticsearchConnector(SIEMConfig(SIEM_COMPACT_KEYS=True))
+
+    doc = orjson.loads(connector.encode_event(make_event("SECRET-JWT")).splitlines()[1])
+
+    assert doc["r"] == "SECRET-JWT"
+    assert "rule_id" not in doc
+    assert "@timestamp" in doc
+
+
+def test_event_dict_is_memoized_and_not_mutated_by_connectors() -> None:
+    event = make_event()
+    connector = ElasticsearchConnector(SIEMConfig())
+
+    connector.encode_event(event)
+
+    assert event.to_dict() is event.to_dict()
+    assert "timestamp" in event.to_dict()
+    assert event.to_json() == orjson.dumps(event.to_dict())
+
+
+@pytest.mark.asyncio
+async def test_webhook_streams_body_with_exact_length_on_every_attempt() -> None:
+    bodies: list[tuple[bytes, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.read(), request.headers.get("content-length")))
+        return httpx.Response(503 if len(bodies) == 1 else 200)
+
+    connector = WebhookConnector(
+        SIEMConfig(SIEM_WEBHOOK_URL="http://siem", SIEM_RETRY_DELAY=0.1, SIEM_RETRY_MAX_DELAY=0.1)
+    )
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await connector.send_events([make_event("A"), make_event("B")])
+
+    assert len(bodies) == 2
+    assert bodies[0] == bodies[1]
+    body, length = bodies[1]
+    assert length == str(len(body))
+    assert [e["rule_id"] for e in orjson.loads(body)["events"]] == ["A", "B"]
+
+    await connector.disconnect()
+
+
+def test_webhook_custom_headers_are_parsed_once() -> None:
+    connector = WebhookConnector(
+        SIEMConfig(SIEM_WEBHOOK_HEADERS='{"X-Tenant": "acme"}', SIEM_WEBHOOK_AUTH_HEADER="Bearer t")
+    )
+
+    headers = connector._request_headers()
+
+    assert headers["X-Tenant"] == "acme"
+    assert headers["Authorization"] == "Bearer t"
+    assert connector._request_headers() is headers
+    assert WebhookConnector(SIEMConfig(SIEM_WEBHOOK_HEADERS="[1]"))._custom_headers == {}
+
+
+def test_queue_finding_is_a_no_op_when_disabled() -> None:
+    manager = SIEMManager(SIEMConfig(SIEM_ENABLED=False))
+
+    assert manager.queue_finding(rule_id="PII-EMAIL", action="mask", severity="low")
+    assert len(manager._queue) == 0
+    assert manager.metrics.events_queued == 0
+
+
+def test_validate_config_reflects_copied_config() -> None:
+    config = SIEMConfig(SIEM_ENABLED=True, SIEM_CONNECTOR_TYPE="splunk")
+
+    assert "SIEM_SPLUNK_TOKEN is required for Splunk connector" in config.validate_config()
+    assert config.model_copy(update={"enabled": False}).validate_config() == []
+
+
+def test_full_queue_rejects_new_events_instead_of_evicting_old_ones() -> None:
+    manager = SIEMManager(SIEMConfig(SIEM_ENABLED=True))
+    manager.MAX_QUEUE_SIZE = 2  # type: ignore[misc]
+
+    results = [
+        manager.queue_finding(rule_id=rule_id, action="mask", severity="low")
+        for rule_id in ("A", "B", "C")
+    ]
+
+    assert results == [True, True, False]
+    assert [event.rule_id for event in manager._queue] == ["A", "B"]
+    assert manager.metrics.events_rejected == 1
+
+
+def test_connector_target_urls_are_resolved_once() -> None:
+    splunk = SplunkConnector(SIEMConfig(SIEM_SPLUNK_URL="https://splunk:8088/"))
+    elastic = ElasticsearchConnector(
+        SIEMConfig(SIEM_ELASTIC_URL="https://es:9200/", SIEM_COMPACT_KEYS=True)
+    )
+
+    assert splunk._url == "https://splunk:8088/services/collector/event"
+    assert elastic._bulk_url == "https://es:9200/_bulk?pipeline=egress-guard-events-expand-keys"
+
+
+@pytest.mark.asyncio
+async def test_elastic_bulk_response_errors_are_detected() -> None:
+    responses = [
+        b'{"took":3,"errors":false,"items":[]}',
+        b'{"took":3,"errors":true,"items":[{"index":{"status":400}}]}',
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=responses.pop(0))
+
+    connector = ElasticsearchConnector(SIEMConfig(SIEM_ELASTIC_URL="http://es"))
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await connector.send_events([make_event()]) is True
+    assert await connector.send_events([make_event()]) is False
+
+    await connector.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_only_calls_known_health_endpoints() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    splunk = SplunkConnector(SIEMConfig(SIEM_SPLUNK_URL="https://splunk:8088/"))
+    webhook = WebhookConnector(SIEMConfig(SIEM_WEBHOOK_URL="https://hooks.example/siem"))
+    for connector in (splunk, webhook):
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await connector.warm_up()
+        await connector.disconnect()
+
+    assert [(r.method, str(r.url)) for r in requests] == [
+        ("GET", "https://splunk:8088/services/collector/health")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_elastic_warm_up_sends_bulk_credentials() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    connector = ElasticsearchConnector(
+        SIEMConfig(
+            SIEM_ELASTIC_URL="https://es:9200",
+            SIEM_ELASTIC_USERNAME="guard",
+            SIEM_ELASTIC_PASSWORD="secret",
+        )
+    )
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await connector.warm_up()
+    await connector.disconnect()
+
+    assert str(requests[0].url) == "https://es:9200/_cluster/health"
+    assert (
+        requests[0].headers["Authorization"]
+        == "Basic " + base64.b64encode(b"guard:secret").decode()
+    )
+
+
+@pytest.mark.asyncio
+async def test_elastic_falls_back_to_full_keys_when_pipeline_install_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "PUT":
+            return httpx.Response(403)
+        return httpx.Response(200, content=b'{"took":1,"errors":false,"items":[]}')
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler)),
+    )
+    connector = ElasticsearchConnector(
+        SIEMConfig(SIEM_ELASTIC_URL="http://es", SIEM_COMPACT_KEYS=True, SIEM_RETRY_COUNT=0)
+    )
+
+    await connector.connect()
+    assert await connector.send_events([make_event("SECRET-JWT")])
+    await connector.disconnect()
+
+    bulk = requests[-1]
+    assert str(bulk.url) == "http://es/_bulk"
+    assert orjson.loads(bulk.read().splitlines()[1])["rule_id"] == "SECRET-JWT"
+
+
+def test_compact_keys_escape_colliding_metadata() -> None:
+    connector = ElasticsearchConnector(SIEMConfig(SIEM_COMPACT_KEYS=True))
+    event = SIEMEvent(
+        event_type="finding",
+        rule_id="PII-EMAIL",
+        action="mask",
+        severity="low",
+        metadata={"r": "user value", "region": "eu"},
+    )
+
+    doc = orjson.loads(connector.encode_event(event).splitlines()[1])
+
+    assert doc["r"] == "PII-EMAIL"
+    assert doc["meta_r"] == "user value"
+    assert doc["region"] == "eu"
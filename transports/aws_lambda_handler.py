@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from app.main import create_app
+# Reuse the application built by app.main instead of constructing a second one
+from app.main import app
 
-app = create_app()
+__all__ = ["app", "handler"]
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:  # pragma: no cover - stub
@@ -6,9 +6,10 @@ import os
 
 import uvicorn
 
-from app.main import create_app
+# Reuse the application built by app.main instead of constructing a second one
+from app.main import app
 
-app = create_app()
+__all__ = ["app"]
 
 
 if __name__ == "__main__":  # pragma: no cover - manual run helper